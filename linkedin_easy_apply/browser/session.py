@@ -1,27 +1,94 @@
 """Browser session management"""
 
+import os
+from urllib.parse import urlparse
+
 from playwright.sync_api import sync_playwright
 
+# Headless unless HEADLESS=0 - a visible window is only needed to log in or watch
+HEADLESS = os.environ.get("HEADLESS", "1") != "0"
+
+# Subresources the bot never reads - stylesheets stay since visibility checks need them
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "texttrack"}
+
+# Analytics/ad hosts - nothing on the Easy Apply path depends on them. Matched
+# against the request hostname (exact or subdomain), never the full URL
+BLOCKED_HOSTS = (
+    "px.ads.linkedin.com",
+    "dpm.demdex.net",
+    "doubleclick.net",
+    "google-analytics.com",
+)
+
+# Runs before any page script on every page of the context - registered once
+STEALTH_INIT_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+if (!window.chrome) window.chrome = {runtime: {}};
+"""
+
+# Single Playwright driver per process - relaunching a context reuses it
+_playwright = None
+
+
+def _is_blocked_host(hostname):
+    """True for a BLOCKED_HOSTS entry or any subdomain of one"""
+    if not hostname:
+        return False
+    return any(
+        hostname == host or hostname.endswith("." + host) for host in BLOCKED_HOSTS
+    )
+
+
+def _block_heavy_resources(route):
+    """Abort heavy subresources and tracking requests; let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    elif _is_blocked_host(urlparse(request.url).hostname):
+        route.abort()
+    else:
+        route.continue_()
+
 
-def launch_browser():
+def launch_browser(user_data_dir="./browser_data"):
     """
     Launch persistent browser context and return (context, page).
     Reuses login session across runs.
+    Safe to call again after closing the previous context (batch recycling).
+    Parallel runs each need their own user_data_dir - Chromium locks a profile.
     """
+    global _playwright
+
     print("Launching browser...")
 
-    p = sync_playwright().start()
+    if _playwright is None:
+        _playwright = sync_playwright().start()
 
-    context = p.chromium.launch_persistent_context(
-        user_data_dir="./browser_data",
-        headless=True,
+    context = _playwright.chromium.launch_persistent_context(
+        user_data_dir=user_data_dir,
+        headless=HEADLESS,
         args=[
             "--disable-blink-features=AutomationControlled",
             "--disable-features=site-per-process",
+            # Trim background work and per-page memory
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-sync",
+            "--mute-audio",
         ],
         user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     )
 
+    # Fail fast on missing elements - explicit waits pass their own timeouts
+    context.set_default_timeout(5000)
+
+    # Registered on the context so every page opened from it is covered
+    context.route("**/*", _block_heavy_resources)
+    context.add_init_script(script=STEALTH_INIT_SCRIPT)
+
     page = context.pages[0] if context.pages else context.new_page()
 
     return context, page
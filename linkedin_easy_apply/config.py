@@ -11,6 +11,13 @@
 DEV_TEST_SPEED = False
 SUPER_DEV_SPEED = True  # ⚡ Maximum safe speed for rapid testing
 
+# ========================================
+# CONSOLE OUTPUT
+# ========================================
+# Per-field detail lines (options, matched key, confidence, classification).
+# Set False by --quiet for long batch runs
+VERBOSE = True
+
 # ========================================
 # TIMING PROFILES
 # ========================================
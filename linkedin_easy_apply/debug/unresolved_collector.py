@@ -14,10 +14,10 @@ Output:
 """
 
 import json
-from datetime import datetime
-from zoneinfo import ZoneInfo
 from typing import Dict, List, Optional
 
+from linkedin_easy_apply.utils.logging import timestamp
+
 _unresolved_buffer: List[Dict] = []
 
 
@@ -57,7 +57,7 @@ def record_unresolved_field(
     """
     _unresolved_buffer.append(
         {
-            "timestamp": datetime.now(ZoneInfo("America/Detroit")).isoformat(),
+            "timestamp": timestamp(),
             "job_id": job_id,
             "job_url": job_url,
             "state_at_exit": state_at_exit,
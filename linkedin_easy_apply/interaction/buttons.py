@@ -1,46 +1,61 @@
 """Button interactions"""
 
-import time
+import re
 
 
-def activate_button_in_modal(page, button_text):
-    """Focus and activate button INSIDE modal only - NO page-wide tabbing"""
-    try:
-        # Modal-scoped selectors only - will NEVER escape modal context
-        selectors = [
-            f'[role="dialog"] button:has-text("{button_text}")',
-            f'[role="dialog"] button[aria-label*="{button_text}"]',
-        ]
+# Resolves once nothing inside the dialog is marked busy - immediately when
+# the click did not start a re-render
+_MODAL_SETTLED_JS = """() =>
+    !document.querySelector('[role="dialog"] [aria-busy="true"]')"""
 
-        for selector in selectors:
-            if page.locator(selector).count() > 0:
-                btn = page.locator(selector).first
 
-                # Check if button is disabled
-                is_disabled = btn.is_disabled()
-                if is_disabled:
-                    print(f"  ⚠️ '{button_text}' button found but DISABLED")
-                    print(f"     This usually means required fields are not filled")
+def activate_button_in_modal(page, button_text, modal=None):
+    """
+    Focus and activate button INSIDE modal only - NO page-wide tabbing.
+    modal is an optional [role="dialog"] locator the caller already holds.
+    """
+    try:
+        if modal is None:
+            modal = page.locator('[role="dialog"]')
 
-                    # Check for any visible error messages or required field indicators
-                    error_selectors = [
+        # Modal-scoped lookup only - will NEVER escape modal context.
+        # Matched by accessible name (aria-label, else visible text), so one
+        # role query covers both the text and aria-label cases
+        btn = modal.get_by_role(
+            "button", name=re.compile(re.escape(button_text), re.I)
+        ).first
+        if btn.count() > 0:
+            # Check if button is disabled
+            is_disabled = btn.is_disabled()
+            if is_disabled:
+                print(f"  ⚠️ '{button_text}' button found but DISABLED")
+                print(f"     This usually means required fields are not filled")
+
+                # Check for any visible error messages or required field indicators
+                error_selector = ", ".join(
+                    [
                         '[role="dialog"] .artdeco-inline-feedback--error',
                         '[role="dialog"] [role="alert"]',
                         '[role="dialog"] .error-message',
                     ]
-                    for err_sel in error_selectors:
-                        if page.locator(err_sel).count() > 0:
-                            error_text = page.locator(err_sel).first.inner_text()
-                            print(f"     Error message: {error_text[:100]}")
+                )
+                error_texts = page.locator(error_selector).all_inner_texts()
+                for error_text in error_texts[:3]:
+                    print(f"     Error message: {error_text[:100]}")
+
+                return False
 
-                    return False
+            btn.focus()
+            page.keyboard.press("Enter")
 
-                btn.focus()
-                time.sleep(0.5)
-                page.keyboard.press("Enter")
-                time.sleep(1)
-                print(f"  ✓ Activated '{button_text}' button in modal")
-                return True
+            # Callers wait for the step/success change themselves; this only
+            # holds off until the modal is no longer busy
+            try:
+                page.wait_for_function(_MODAL_SETTLED_JS, timeout=5000)
+            except:
+                pass
+            print(f"  ✓ Activated '{button_text}' button in modal")
+            return True
 
         print(f"  ⚠️ '{button_text}' button not found in modal")
         return False
@@ -49,24 +64,165 @@ def activate_button_in_modal(page, button_text):
         return False
 
 
+AUTH_WALL_SEL = ".authwall, form.login__form"
+
+
+def is_auth_wall(page):
+    """True when LinkedIn served a login/auth wall instead of the job page"""
+    url = page.url
+    if "/authwall" in url or "/login" in url:
+        return True
+    return page.locator(AUTH_WALL_SEL).count() > 0
+
+
+def wait_for_job_page(page, timeout=5000):
+    """
+    Wait for the job page's apply area (or an auth wall) instead of a fixed sleep.
+    Returns "ready", "authwall", or None on timeout.
+    """
+    selector = ", ".join(
+        [
+            "button.jobs-apply-button",
+            '[aria-label*="Easy Apply"]',
+            '[data-test-job-apply-state="APPLIED"]',
+            AUTH_WALL_SEL,
+        ]
+    )
+    try:
+        page.wait_for_selector(selector, state="visible", timeout=timeout)
+    except:
+        if is_auth_wall(page):
+            return "authwall"
+        print("  ⚠️ Job page apply area not detected before timeout")
+        return None
+    return "authwall" if is_auth_wall(page) else "ready"
+
+
+def wait_for_modal_ready(page, timeout=1000):
+    """
+    Wait for the modal's navigation buttons or file input to render.
+    The default ceiling matches the fixed 1s sleep this replaced.
+    """
+    selector = ", ".join(
+        [
+            '[role="dialog"] button:has-text("Next")',
+            '[role="dialog"] button:has-text("Continue")',
+            '[role="dialog"] button:has-text("Review")',
+            '[role="dialog"] button:has-text("Submit")',
+            '[role="dialog"] input[type="file"]',
+        ]
+    )
+    try:
+        page.wait_for_selector(selector, state="attached", timeout=timeout)
+        return True
+    except:
+        return False
+
+
+# Identifies the modal's current step: its heading plus the progress value.
+# Spinners, "uploading..." labels and inline errors change the dialog's text
+# but not these. Falls back to the whole innerText when a layout has neither
+_STEP_SIGNATURE_FN = """dialog => {
+    const heading = dialog.querySelector("h1, h2, h3");
+    const progress = dialog.querySelector('[role="progressbar"], progress');
+    if (!heading && !progress) return dialog.innerText;
+    const value = progress
+        ? progress.getAttribute("aria-valuenow") || String(progress.value || "")
+        : "";
+    return `${heading ? heading.innerText.trim() : ""}|${value}`;
+}"""
+
+_MODAL_TEXT_JS = (
+    """() => {
+    const stepSignature = """
+    + _STEP_SIGNATURE_FN
+    + """;
+    const dialog = document.querySelector('[role="dialog"]');
+    return dialog ? stepSignature(dialog) : "";
+}"""
+)
+
+# Resolves on the first DOM mutation after which the modal is gone, or is no
+# longer aria-busy and shows a different step - no polling. Checks once up
+# front in case the step already changed before the observer was attached
+_MODAL_CHANGED_JS = (
+    """([previous, timeout]) => new Promise(resolve => {
+    const stepSignature = """
+    + _STEP_SIGNATURE_FN
+    + """;
+    const changed = () => {
+        const dialog = document.querySelector('[role="dialog"]');
+        if (!dialog) return true;
+        if (dialog.querySelector('[aria-busy="true"]')) return false;
+        return stepSignature(dialog) !== previous;
+    };
+    if (changed()) return resolve(true);
+
+    const observer = new MutationObserver(() => {
+        if (changed()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    observer.observe(document.body, {
+        childList: true,
+        subtree: true,
+        characterData: true,
+        attributes: true,
+        attributeFilter: ["aria-busy", "aria-valuenow", "value"],
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(false);
+    }, timeout);
+})"""
+)
+
+
+def get_modal_text(page):
+    """Snapshot the modal's step signature so a later step change can be detected"""
+    try:
+        return page.evaluate(_MODAL_TEXT_JS)
+    except:
+        return ""
+
+
+def wait_for_modal_change(page, previous_text, timeout=2000):
+    """Wait until the modal shows a step other than previous_text (or it closes)"""
+    try:
+        return page.evaluate(_MODAL_CHANGED_JS, [previous_text, timeout])
+    except:
+        return False
+
+
 def wait_for_easy_apply_modal(page, timeout=30000):
     """Wait for Easy Apply modal to appear with comprehensive selectors"""
     print("Waiting for Easy Apply modal...")
 
-    selectors = [
-        'div[role="dialog"]',
-        ".jobs-easy-apply-modal",
-        ".artdeco-modal",
-        "div.jobs-easy-apply-modal__content",
-        ".artdeco-modal__content",
-    ]
-
-    for selector in selectors:
-        try:
-            page.wait_for_selector(selector, state="visible", timeout=timeout)
-            print(f"  ✓ Modal detected via: {selector}")
-            return True
-        except:
-            continue
+    # One selector list races all alternatives in a single wait, so a missing
+    # modal costs one timeout instead of one per selector
+    selector = ", ".join(
+        [
+            'div[role="dialog"]',
+            ".jobs-easy-apply-modal",
+            ".artdeco-modal",
+            "div.jobs-easy-apply-modal__content",
+            ".artdeco-modal__content",
+        ]
+    )
 
-    return False
+    try:
+        modal = page.wait_for_selector(selector, state="visible", timeout=timeout)
+    except:
+        return False
+
+    # Report which alternative won the race, from the handle the wait returned
+    try:
+        matched = modal.evaluate(
+            "el => el.getAttribute('role') === 'dialog' ? '[role=dialog]' : el.className"
+        )
+        print(f"  ✓ Modal detected ({matched})")
+    except:
+        print("  ✓ Modal detected")
+    return True
@@ -10,15 +10,10 @@ def keyboard_fill_input(page, selector, value, label="field"):
     try:
         element = page.locator(selector).first
         if element.count() > 0:
-            # Focus element
-            element.focus()
-            human_delay(200, 400)
-
-            # Clear existing value
-            page.keyboard.press("Control+a")
-            human_delay(100, 200)
+            # Clear existing value - fill() also focuses the element
+            element.fill("")
 
-            # Type new value with realistic delays
+            # Type new value with realistic per-key delays, then one pause
             page.keyboard.type(value, delay=random.randint(50, 150))
             human_delay(200, 400)
             print(f"  ✓ Filled {label}: {value}")
@@ -52,52 +47,52 @@ def keyboard_select_radio(page, group_name, label="radio group"):
     return False
 
 
+# Walks the page's tab order in one round-trip instead of Tab + evaluate per
+# stop: positive tabindex first, then tabindex 0 in document order, skipping
+# disabled and invisible elements. The first stop whose text (first 100 chars)
+# or aria-label contains the target is focused; null if none within maxTabs
+_FOCUS_WALK_JS = """([target, maxTabs]) => {
+    const visible = el => el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== "hidden";
+    const candidates = Array.from(document.querySelectorAll(
+        'a[href], button, input, select, textarea, [tabindex]'
+    )).filter(el => el.tabIndex >= 0 && !el.disabled && el.type !== "hidden"
+        && visible(el));
+    const positive = candidates.filter(el => el.tabIndex > 0)
+        .sort((a, b) => a.tabIndex - b.tabIndex);
+    const tabOrder = positive.concat(candidates.filter(el => el.tabIndex === 0));
+
+    for (const [i, el] of tabOrder.slice(0, maxTabs).entries()) {
+        const text = (el.textContent || "").trim().substring(0, 100);
+        if (!text) continue;
+        const aria = (el.getAttribute("aria-label") || "").toLowerCase();
+        if (text.toLowerCase().includes(target) || aria.includes(target)) {
+            el.focus();
+            return { tab: i + 1, tag: el.tagName, text };
+        }
+    }
+    return null;
+}"""
+
+
 def keyboard_navigate_and_click_button(page, button_text, max_tabs=30):
     """Navigate to button/link using Tab and activate with Enter"""
     try:
         print(f"  Navigating to '{button_text}' using keyboard Tab navigation...")
 
-        # Reset focus to body (exactly like test script)
+        # Dismiss any open popover before walking the tab order
         page.keyboard.press("Escape")
         time.sleep(0.5)
-        page.evaluate("document.body.focus()")
-        time.sleep(0.3)
-
-        # Tab through elements to find our target
-        for i in range(max_tabs):
-            page.keyboard.press("Tab")
-            time.sleep(0.1)  # Small delay to let focus update
-
-            # Get focused element info (exactly like test script)
-            focused_info = page.evaluate(
-                """() => {
-                const el = document.activeElement;
-                if (!el) return null;
-                return {
-                    tag: el.tagName,
-                    text: el.textContent?.trim().substring(0, 100),
-                    type: el.type,
-                    ariaLabel: el.getAttribute('aria-label'),
-                    classes: el.className
-                };
-            }"""
-            )
-
-            # Check if we found it (must check focused_info exists first)
-            if focused_info and focused_info.get("text"):
-                text_lower = focused_info.get("text", "").lower()
-                aria_lower = (focused_info.get("ariaLabel") or "").lower()
-                target_lower = button_text.lower()
-
-                # Match if target text is in either the text content or aria-label
-                if target_lower in text_lower or target_lower in aria_lower:
-                    tag = focused_info.get("tag", "")
-                    print(f"  ✓ Found '{button_text}' via Tab #{i+1}")
-                    print(f"    Tag: {tag}, Text: '{focused_info.get('text')}'")
-                    time.sleep(0.5)
-                    page.keyboard.press("Enter")
-                    time.sleep(2)
-                    return True
+
+        # Find and focus the target in-page, then activate it with a real Enter
+        focused_info = page.evaluate(_FOCUS_WALK_JS, [button_text.lower(), max_tabs])
+        if focused_info:
+            print(f"  ✓ Found '{button_text}' via Tab #{focused_info['tab']}")
+            print(f"    Tag: {focused_info['tag']}, Text: '{focused_info['text']}'")
+            # The walk focused the target synchronously, and the caller
+            # waits for whatever the Enter opens
+            page.keyboard.press("Enter")
+            return True
 
         print(f"  ⚠️ Could not find '{button_text}' after {max_tabs} tabs")
         return False
@@ -5,24 +5,23 @@ Modular refactor - behavior unchanged
 """
 
 import sys
-import json
 import time
-import random
 import argparse
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+import re
+import itertools
+import mimetypes
+from datetime import datetime
 import os
 
 # Local imports
 from linkedin_easy_apply.browser.session import launch_browser
-from linkedin_easy_apply.state.detector import detect_state
-from linkedin_easy_apply.perception.text_fields import (
-    detect_text_fields_in_modal,
-    detect_inline_validation_error,
-)
+from linkedin_easy_apply.state.detector import detect_state, modal_text_fields
+from linkedin_easy_apply.perception.text_fields import detect_inline_validation_error
 from linkedin_easy_apply.perception.radios import detect_radio_groups
 from linkedin_easy_apply.perception.checkboxes import detect_checkbox_groups
 from linkedin_easy_apply.perception.selects import detect_select_fields
+from linkedin_easy_apply.perception.form_summary import count_form_elements
+from linkedin_easy_apply.perception.file_inputs import detect_file_input
 from linkedin_easy_apply.reasoning.classify import classify_field_type
 from linkedin_easy_apply.reasoning.resolve_text import resolve_field_answer
 from linkedin_easy_apply.reasoning.resolve_radio import resolve_radio_question
@@ -31,8 +30,17 @@ from linkedin_easy_apply.interaction.keyboard import keyboard_navigate_and_click
 from linkedin_easy_apply.interaction.buttons import (
     activate_button_in_modal,
     wait_for_easy_apply_modal,
+    wait_for_job_page,
+    wait_for_modal_ready,
+    get_modal_text,
+    wait_for_modal_change,
+)
+from linkedin_easy_apply.utils.logging import (
+    LOG_TZ,
+    log_event,
+    log_result,
+    timestamp,
 )
-from linkedin_easy_apply.utils.logging import log_result
 from linkedin_easy_apply.utils.timing import human_delay
 import linkedin_easy_apply.config as config
 
@@ -46,6 +54,88 @@ SKIP_VALIDATION_ERROR = "validation_error"
 SKIP_NO_FORM_ELEMENTS = "no_form_elements"
 SKIP_MODAL_NOT_DETECTED = "modal_not_detected"
 SKIP_ALREADY_APPLIED = "already_applied"
+SKIP_AUTH_WALL = "auth_wall"
+
+# Selectors reused across the form analysis and state loop
+EASY_APPLY_SEL = '[aria-label*="Easy Apply"], button:has-text("Easy Apply")'
+FILE_INPUT_SEL = 'input[type="file"]'
+SUBMIT_BTN_SEL = 'button:has-text("Submit")'
+INVALID_FIELD_SEL = (
+    '[role="dialog"] input[aria-invalid="true"], [role="dialog"] select[aria-invalid="true"]'
+)
+
+# Post-submit confirmation - case-insensitive substring matches like the
+# baseline's :has-text(), scoped to headings and text elements rather than a
+# bare :has-text(), which also matches every ancestor up to <html>
+SUBMIT_SUCCESS_SEL = ", ".join(
+    [
+        'h2:has-text("Application sent")',
+        'h3:has-text("Application sent")',
+        'p:has-text("Your application was sent")',
+        'span:has-text("Your application was sent")',
+    ]
+)
+
+# Batch mode relaunches the browser context every N jobs to keep memory bounded
+CONTEXT_RECYCLE_EVERY = 200
+
+# Keyword sets matched as substrings of lowercased labels - built once here
+# rather than as list literals inside the per-field loops
+PHOTO_UPLOAD_KEYWORDS = ("photo", "picture", "image", "headshot", "avatar")
+CONSENT_CHECKBOX_KEYWORDS = ("agree", "consent", "terms", "acknowledge", "confirm")
+COMMUNICATION_CHECKBOX_KEYWORDS = (
+    "email",
+    "communication",
+    "updates",
+    "marketing",
+    "newsletter",
+    "inform",
+    "receive",
+)
+
+# Checkbox label categories, one alternation scan per label instead of a
+# substring check per keyword
+CONSENT_CHECKBOX_RE = re.compile("|".join(map(re.escape, CONSENT_CHECKBOX_KEYWORDS)))
+COMMUNICATION_CHECKBOX_RE = re.compile(
+    "|".join(map(re.escape, COMMUNICATION_CHECKBOX_KEYWORDS))
+)
+
+# Overridable per machine; checked once before the browser starts
+RESUME_PATH = os.environ.get(
+    "RESUME_PATH", "/Users/sawyersmith/Documents/resume2025.pdf"
+)
+RESUME_FILENAME = os.path.basename(RESUME_PATH)
+
+# File name display elements that show the resume is already attached
+RESUME_DISPLAY_SEL = ", ".join(
+    [
+        f':text-is("{RESUME_FILENAME}")',
+        f'[class*="file"][class*="name"]:has-text("{RESUME_FILENAME}")',
+        f'[class*="upload"]:has-text("{RESUME_FILENAME}")',
+    ]
+)
+
+# Any interactive control inside the Easy Apply modal - the state loop waits
+# for one to render instead of sleeping a fixed interval per step
+MODAL_CONTROL_SEL = ", ".join(
+    [
+        '[role="dialog"] button',
+        '[role="dialog"] input',
+        '[role="dialog"] select',
+    ]
+)
+
+# Sets a native <select>'s value, fires the events React listens for and
+# returns the value that stuck - assignment and verification in one call
+_SET_SELECT_VALUE_JS = """(el, value) => {
+    el.value = value;
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    return el.value;
+}"""
+
+# Resume bytes read on first upload and reused for every later job
+_resume_payload = None
 
 
 def format_elapsed_time(seconds):
@@ -82,6 +172,19 @@ def finalize_job(is_batch_mode, context, status):
         return None
 
 
+def wait_for_submit_success(submit_success, timeout=10000):
+    """
+    Wait for any post-submit confirmation to become visible.
+    Resolves on the first match instead of sleeping and then probing.
+    submit_success must already be filtered to visible matches.
+    """
+    try:
+        submit_success.first.wait_for(state="visible", timeout=timeout)
+        return True
+    except:
+        return False
+
+
 def handle_violation(violation_type, violation_msg, interactive_mode, elapsed_time):
     """
     Centralized decision point for all state-machine violations.
@@ -140,19 +243,113 @@ def flush_debug_unresolved_if_enabled(debug_unresolved):
         flush_unresolved_fields()
 
 
+def get_resume_payload():
+    """Return the resume as an in-memory set_input_files payload"""
+    global _resume_payload
+    if _resume_payload is None:
+        with open(RESUME_PATH, "rb") as f:
+            _resume_payload = {
+                "name": RESUME_FILENAME,
+                # RESUME_PATH is overridable, so the type follows its extension
+                "mimeType": mimetypes.guess_type(RESUME_PATH)[0]
+                or "application/octet-stream",
+                "buffer": f.read(),
+            }
+    return _resume_payload
+
+
+def is_job_url(url):
+    """Cheap sanity check that a URL points at a LinkedIn job posting"""
+    return "linkedin.com" in url and "/jobs/" in url
+
+
+def iter_job_links(lines):
+    """
+    Yield job URLs from an iterable of lines. Strips comments and deduplicates.
+    Lines that are not LinkedIn job URLs are reported and skipped.
+    """
+    seen = set()
+    for line in lines:
+        # Strip whitespace and ignore comments
+        line = line.strip()
+        if line and not line.startswith("#"):
+            if not is_job_url(line):
+                print(f"⚠️ Not a LinkedIn job URL - ignoring: {line}")
+            elif line not in seen:
+                seen.add(line)
+                yield line
+
+
+def parse_shard(value):
+    """argparse type for --shard: 'K/N' -> (K, N) with 1 <= K <= N"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected K/N, got '{value}'")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {value} out of range")
+    return (index, count)
+
+
 def load_job_links(file_path):
     """Load job URLs from file, one per line. Strips comments and deduplicates."""
     with open(file_path, "r") as f:
-        urls = []
-        seen = set()
-        for line in f:
-            # Strip whitespace and ignore comments
-            line = line.strip()
-            if line and not line.startswith("#"):
-                if line not in seen:
-                    urls.append(line)
-                    seen.add(line)
-        return urls
+        return list(iter_job_links(f))
+
+
+# Probe for is_already_applied. Mirrors the selectors it replaced:
+#   primary button - button.jobs-apply-button, button[aria-label*="Easy Apply"],
+#                    button:has-text("Easy Apply") (first in document order)
+#   status badges  - the applicant-count / inline-feedback / footer chips
+#                    containing "Applied", or data-test-job-apply-state=APPLIED;
+#                    returns the original selector that matched, for the reason
+#   confirmation   - an element whose whole text is one of the sent messages
+_ALREADY_APPLIED_PROBE_JS = """() => {
+    const norm = el => (el.textContent || "").replace(/\\s+/g, " ").trim();
+    const buttons = Array.from(document.querySelectorAll("button"));
+    const isEasyApplyText = btn => norm(btn).toLowerCase().includes("easy apply");
+
+    const primary = buttons.find(btn =>
+        btn.matches('.jobs-apply-button, [aria-label*="Easy Apply"]')
+        || isEasyApplyText(btn)
+    );
+
+    const hasApplied = sel => Array.from(document.querySelectorAll(sel))
+        .some(el => norm(el).toLowerCase().includes("applied"));
+    // [selector reported in the reason, test] in the original check order
+    const badgeChecks = [
+        ['.jobs-unified-top-card__applicant-count:has-text("Applied")',
+            () => hasApplied(".jobs-unified-top-card__applicant-count")],
+        ['.artdeco-inline-feedback:has-text("Applied")',
+            () => hasApplied(".artdeco-inline-feedback")],
+        ['[data-test-job-apply-state="APPLIED"]',
+            () => document.querySelector('[data-test-job-apply-state="APPLIED"]') !== null],
+        ['.job-card-container__footer-item:has-text("Applied")',
+            () => hasApplied(".job-card-container__footer-item")],
+    ];
+    const matchedBadge = badgeChecks.find(([, test]) => test());
+    const statusBadge = matchedBadge ? matchedBadge[0] : null;
+
+    const sentTexts = new Set([
+        "Application sent",
+        "Your application was sent",
+        "Application submitted",
+    ]);
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    let confirmation = false;
+    while (!confirmation && walker.nextNode()) {
+        const parent = walker.currentNode.parentElement;
+        confirmation = parent !== null && sentTexts.has(norm(parent));
+    }
+
+    return {
+        button_text: primary ? primary.innerText.trim() : null,
+        button_disabled: primary ? primary.disabled : false,
+        status_badge: statusBadge,
+        confirmation: confirmation,
+        easy_apply_button: buttons.some(isEasyApplyText),
+    };
+}"""
 
 
 def is_already_applied(page):
@@ -170,70 +367,37 @@ def is_already_applied(page):
     Returns: (bool, str) - (is_applied, reason)
     """
 
-    # 1️⃣ Check Easy Apply button state FIRST (most reliable)
+    # All three checks read from one in-page probe - they are independent,
+    # so there is no reason to pay a round-trip for each
     try:
-        # Look for primary action button
-        primary_button = page.locator(
-            'button.jobs-apply-button, button[aria-label*="Easy Apply"], button:has-text("Easy Apply")'
-        ).first
-
-        if primary_button.count() > 0:
-            button_text = primary_button.inner_text().strip()
+        probe = page.evaluate(_ALREADY_APPLIED_PROBE_JS)
+    except:
+        return (False, "")
 
-            # Exact match: button says "Applied" (not "Easy Apply")
-            if button_text == "Applied":
-                return (True, "button_exact_text: Applied")
+    # 1️⃣ Check Easy Apply button state FIRST (most reliable)
+    button_text = probe["button_text"]
+    if button_text is not None:
+        # Exact match: button says "Applied" (not "Easy Apply")
+        if button_text == "Applied":
+            return (True, "button_exact_text: Applied")
 
-            # Button says "View application"
-            if "View application" in button_text:
-                return (True, "button_text: View application")
+        # Button says "View application"
+        if "View application" in button_text:
+            return (True, "button_text: View application")
 
-            # Button is disabled AND contains "Applied"
-            try:
-                if primary_button.is_disabled() and "Applied" in button_text:
-                    return (True, "button_disabled_applied")
-            except:
-                pass
-    except:
-        pass
+        # Button is disabled AND contains "Applied"
+        if probe["button_disabled"] and "Applied" in button_text:
+            return (True, "button_disabled_applied")
 
     # 2️⃣ Check for explicit application status badges/chips
     # These are highly specific UI elements that indicate applied status
-    try:
-        # Look for status badges in the job card header area
-        status_indicators = [
-            '.jobs-unified-top-card__applicant-count:has-text("Applied")',
-            '.artdeco-inline-feedback:has-text("Applied")',
-            '[data-test-job-apply-state="APPLIED"]',
-            '.job-card-container__footer-item:has-text("Applied")',
-        ]
-
-        for indicator in status_indicators:
-            if page.locator(indicator).count() > 0:
-                return (True, f"status_badge: {indicator}")
-    except:
-        pass
+    if probe["status_badge"]:
+        return (True, f"status_badge: {probe['status_badge']}")
 
     # 3️⃣ Check for application confirmation screen
     # Only if we're on a confirmation page with NO Easy Apply button
-    try:
-        confirmation_texts = [
-            'text="Application sent"',
-            'text="Your application was sent"',
-            'text="Application submitted"',
-        ]
-
-        for text in confirmation_texts:
-            if page.locator(text).count() > 0:
-                # Verify no Easy Apply button exists
-                easy_apply_exists = (
-                    page.locator('button:has-text("Easy Apply")').count() > 0
-                )
-                if not easy_apply_exists:
-                    return (True, "confirmation_screen")
-
-    except:
-        pass
+    if probe["confirmation"] and not probe["easy_apply_button"]:
+        return (True, "confirmation_screen")
 
     # If uncertain, proceed normally (conservative approach - never block valid applications)
     return (False, "")
@@ -252,12 +416,17 @@ Speed Modes:
 
 Batch Mode:
   --links-file FILE Process multiple job URLs from file (one per line)
+  --links-file -    Read job URLs from stdin as they arrive (requires --test-mode)
+  --shard K/N       Process every Nth URL starting at K - run N copies in parallel,
+                    each with its own --user-data-dir (copied from a logged-in profile)
 
 Examples:
   python -m linkedin_easy_apply.main "https://linkedin.com/jobs/view/123456789/"
   python -m linkedin_easy_apply.main --speed dev "https://linkedin.com/jobs/view/123456789/"
   python -m linkedin_easy_apply.main --speed super "https://linkedin.com/jobs/view/123456789/"
   python -m linkedin_easy_apply.main --links-file jobs.txt
+  cat jobs.txt | python -m linkedin_easy_apply.main --test-mode --links-file -
+  python -m linkedin_easy_apply.main --test-mode --links-file jobs.txt --shard 2/4 --user-data-dir ./browser_data_2
         """,
     )
     parser.add_argument("job_url", nargs="?", help="LinkedIn job URL to apply to")
@@ -268,7 +437,18 @@ Examples:
     )
     parser.add_argument(
         "--links-file",
-        help="File containing job URLs (one per line) for batch processing",
+        help="File containing job URLs (one per line) for batch processing, or '-' for stdin",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="K/N",
+        help="Process only the Kth of N interleaved slices of --links-file (for parallel runs)",
+    )
+    parser.add_argument(
+        "--user-data-dir",
+        default="./browser_data",
+        help="Browser profile directory (default: ./browser_data); one per parallel run",
     )
     parser.add_argument(
         "--interactive",
@@ -280,6 +460,11 @@ Examples:
         action="store_true",
         help="Test mode - run automation without submitting (validates completeness)",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Omit per-field detail lines (options, classification, confidence) from console output",
+    )
     parser.add_argument(
         "--debug-unresolved",
         action="store_true",
@@ -294,14 +479,51 @@ Examples:
     if args.job_url and args.links_file:
         parser.error("Cannot use both job_url and --links-file")
 
+    # Cheap checks before Chromium is launched - a bad URL should not cost a
+    # browser start
+    if args.job_url and not is_job_url(args.job_url):
+        parser.error(f"Not a LinkedIn job URL: {args.job_url}")
+
+    # stdin carries job URLs in streaming mode, so it cannot also answer the
+    # submission / violation prompts
+    if args.links_file == "-" and not args.test_mode:
+        parser.error("--links-file - requires --test-mode")
+
+    # Parallel shards all prompt on the same terminal, so they only make sense
+    # unattended
+    if args.shard and not (args.links_file and args.test_mode):
+        parser.error("--shard requires --links-file and --test-mode")
+
     # Determine batch mode and load job URLs
     is_batch_mode = args.links_file is not None
-    if is_batch_mode:
+    total_jobs = None
+    if args.links_file == "-":
+        # Streaming: URLs are processed as they arrive against the warm browser
+        job_urls = iter_job_links(sys.stdin)
+        print("📋 Batch mode: reading job URLs from stdin\n")
+    elif is_batch_mode:
         job_urls = load_job_links(args.links_file)
-        print(f"📋 Batch mode: {len(job_urls)} jobs loaded from {args.links_file}\n")
+        total_jobs = len(job_urls)
+        if total_jobs == 0:
+            parser.error(f"No LinkedIn job URLs found in {args.links_file}")
+        print(f"📋 Batch mode: {total_jobs} jobs loaded from {args.links_file}\n")
     else:
         job_urls = [args.job_url]
 
+    if args.shard:
+        shard_index, shard_count = args.shard
+        if total_jobs is None:
+            job_urls = itertools.islice(job_urls, shard_index - 1, None, shard_count)
+        else:
+            job_urls = job_urls[shard_index - 1 :: shard_count]
+            total_jobs = len(job_urls)
+            if total_jobs == 0:
+                parser.error(
+                    f"Shard {shard_index}/{shard_count} of {args.links_file} has no job URLs"
+                )
+        shard_jobs = "streamed" if total_jobs is None else total_jobs
+        print(f"🔀 Shard {shard_index}/{shard_count}: {shard_jobs} jobs\n")
+
     # Configure speed mode based on command-line flag
     if args.speed == "dev":
         config.DEV_TEST_SPEED = True
@@ -318,6 +540,9 @@ Examples:
     # Rebuild TIMING dict after config changes
     config.TIMING = config.get_active_timing()
 
+    # Per-field detail lines are console-only; decisions and results still print
+    config.VERBOSE = not args.quiet
+
     # Mode flags
     interactive_mode = args.interactive
     test_mode = args.test_mode
@@ -340,18 +565,35 @@ Examples:
             "🔍 Debug mode enabled - recording unresolved fields to debug_unresolved.jsonl\n"
         )
 
+    # Checked once for the whole run rather than failing per upload
+    resume_available = os.path.exists(RESUME_PATH)
+    if not resume_available:
+        print(f"⚠️ Resume not found at {RESUME_PATH} - uploads will be skipped\n")
+
     # Batch mode tracking
     batch_results = []
     csv_records = []  # For CSV summary output
 
     # Launch browser once for all jobs
-    context, page = launch_browser()
+    context, page = launch_browser(args.user_data_dir)
 
     # Process each job URL
     for job_index, job_url in enumerate(job_urls, 1):
+        # Batch mode: fresh page per job on the shared context - no state
+        # leaks between jobs and no browser relaunch. The context itself is
+        # recycled periodically so long runs don't grow browser memory unbounded.
+        if is_batch_mode and job_index > 1:
+            if (job_index - 1) % CONTEXT_RECYCLE_EVERY == 0:
+                print(f"\n♻️  Recycling browser context after {job_index - 1} jobs")
+                context.close()
+                context, page = launch_browser(args.user_data_dir)
+            else:
+                page.close()
+                page = context.new_page()
+
         # Initialize job-level tracking for CSV
         job_record = {
-            "timestamp": datetime.now(ZoneInfo("America/Detroit")).isoformat(),
+            "timestamp": timestamp(),
             "job_url": job_url,
             "job_id": job_url.split("/")[-2] if "/jobs/view/" in job_url else "unknown",
             "result": None,
@@ -366,7 +608,7 @@ Examples:
         # Print batch progress header
         if is_batch_mode:
             print("\n" + "=" * 60)
-            print(f"JOB {job_index}/{len(job_urls)}")
+            print(f"JOB {job_index}/{total_jobs}" if total_jobs else f"JOB {job_index}")
             print("=" * 60)
 
         # Start timer for this job
@@ -381,7 +623,25 @@ Examples:
         # Navigate to job page
         print(f"Navigating to {job_url}...")
         page.goto(job_url, wait_until="domcontentloaded", timeout=30000)
-        page.wait_for_timeout(3000)
+        page_status = wait_for_job_page(page)
+
+        # Auth wall means the saved session expired - every remaining job would
+        # hit the same wall, so stop the whole run instead of timing out per URL
+        if page_status == "authwall":
+            print("\n🔒 LinkedIn auth wall - session is not logged in, stopping")
+            print(f"⏱️  Total time: {format_elapsed_time(time.time() - start_time)}")
+            job_record["result"] = "FAILED"
+            job_record["skip_reason"] = SKIP_AUTH_WALL
+            job_record["state_at_exit"] = "AUTH_WALL"
+            job_record["elapsed_seconds"] = time.time() - start_time
+            csv_records.append(job_record)
+            log_result(job_url, "FAILED", "Auth wall - not logged in", steps_completed)
+            status = finalize_job(is_batch_mode, context, "FAILED")
+            if status:
+                batch_results.append(status)
+                break
+            return
+
         steps_completed += 1
 
         # PRE-FLIGHT CHECK: Detect if already applied
@@ -411,12 +671,19 @@ Examples:
         print("🤖 Bot will attempt keyboard navigation to Easy Apply...")
         print("Looking for Easy Apply button...")
 
-        # Try to navigate to Easy Apply using keyboard
-        success = keyboard_navigate_and_click_button(page, "Easy Apply", max_tabs=30)
+        # Fail fast when the page has no Easy Apply control at all - the Tab
+        # walk would otherwise spend every one of its presses proving it
+        if interactive_mode or page.locator(EASY_APPLY_SEL).count() > 0:
+            # Try to navigate to Easy Apply using keyboard
+            success = keyboard_navigate_and_click_button(
+                page, "Easy Apply", max_tabs=30
+            )
+        else:
+            print("⚠️ No Easy Apply button on page")
+            success = False
 
         if success:
             print("✅ Bot successfully activated Easy Apply!")
-            page.wait_for_timeout(2000)
         else:
             if interactive_mode:
                 print("⚠️ Bot couldn't find Easy Apply via keyboard")
@@ -469,36 +736,49 @@ Examples:
             return
 
         steps_completed += 1
-        page.wait_for_timeout(1000)
+        wait_for_modal_ready(page)
 
         # Look for form elements
         print("\nAnalyzing form...")
 
+        # Bound once per job - reused by every step of the state loop
+        resume_inputs = page.locator(FILE_INPUT_SEL)
+        resume_display = page.locator(RESUME_DISPLAY_SEL)
+        modal = page.locator('[role="dialog"]')
+        modal_submit_button = modal.locator(SUBMIT_BTN_SEL)
+        submit_success = page.locator(SUBMIT_SUCCESS_SEL)
+        # Visibility filtered across every match - .first alone would pin the
+        # wait to a hidden heading earlier in the page
+        visible_submit_success = page.locator(f"{SUBMIT_SUCCESS_SEL} >> visible=true")
+        invalid_fields = page.locator(INVALID_FIELD_SEL)
+        aria_invalid = page.locator('[aria-invalid="true"]')
+        # Visibility filtered across every match, so .first is the first
+        # visible control rather than a possibly hidden input
+        modal_controls = page.locator(f"{MODAL_CONTROL_SEL} >> visible=true")
+
+        # One in-page pass for every count below
+        form_counts = count_form_elements(page)
+
         # Check for resume upload
-        resume_upload = page.locator('input[type="file"]').count()
+        resume_upload = form_counts["resume_upload"]
         print(f"  Resume uploads: {resume_upload}")
 
         # Check for next/submit buttons
-        next_btn = page.locator('button:has-text("Next")').count()
-        review_btn = page.locator('button:has-text("Review")').count()
-        submit_btn = page.locator('button:has-text("Submit")').count()
+        next_btn = form_counts["next"]
+        review_btn = form_counts["review"]
+        submit_btn = form_counts["submit"]
         print(f"  Next buttons: {next_btn}")
         print(f"  Review buttons: {review_btn}")
         print(f"  Submit buttons: {submit_btn}")
 
         # Check for text inputs
-        text_inputs = page.locator(
-            'input[type="text"], input[type="number"], textarea'
-        ).count()
-        print(f"  Text inputs: {text_inputs}")
+        print(f"  Text inputs: {form_counts['text_inputs']}")
 
         # Check for selects/dropdowns
-        selects = page.locator("select").count()
-        print(f"  Dropdowns: {selects}")
+        print(f"  Dropdowns: {form_counts['selects']}")
 
         # Check for radio buttons
-        radios = page.locator('input[type="radio"]').count()
-        print(f"  Radio buttons: {radios}")
+        print(f"  Radio buttons: {form_counts['radios']}")
 
         if resume_upload == 0 and next_btn == 0 and submit_btn == 0 and review_btn == 0:
             print("\n❌ No form elements detected")
@@ -523,7 +803,6 @@ Examples:
         # Process multi-step form with state machine
         # No max_steps limit - loop continues until terminal state (SUBMITTED, etc.)
         current_step = 0
-        resume_path = "/Users/sawyersmith/Documents/resume2025.pdf"
         text_fields_processed = (
             False  # Track if text fields were already processed this step
         )
@@ -531,39 +810,34 @@ Examples:
         while True:  # Loop until terminal state
             current_step += 1
 
-            # Wait for page to stabilize
-            page.wait_for_timeout(1000)
+            # Wait for the step to render - same 1000ms ceiling as the old
+            # fixed sleep, but returns as soon as a modal control is visible.
+            # A closed modal (success page) just runs out the ceiling
+            try:
+                modal_controls.first.wait_for(state="visible", timeout=1000)
+            except:
+                pass
 
             # STATE DETECTION FIRST - before any actions
-            state = detect_state(page, current_step)
+            # Once this step's text fields are handled, only buttons matter
+            state = detect_state(
+                page, current_step, text_fields_done=text_fields_processed
+            )
             print(f"\n--- Step {current_step} | State: {state} ---")
 
             # Handle resume upload if present
-            resume_inputs = page.locator('input[type="file"]')
-            if resume_inputs.count() > 0:
+            file_input_info = detect_file_input(page)
+            if file_input_info:
                 # Check if this is a photo/image field (skip resume upload for those)
-                import os
-
-                resume_filename = os.path.basename(resume_path)
-
                 try:
                     file_input = resume_inputs.first
-                    file_label = ""
-                    file_aria_label = file_input.get_attribute("aria-label") or ""
-
-                    # Try to find associated label
-                    input_id = file_input.get_attribute("id")
-                    if input_id:
-                        label_el = page.locator(f'label[for="{input_id}"]')
-                        if label_el.count() > 0:
-                            file_label = label_el.first.inner_text().lower()
-
-                    combined_label = f"{file_label} {file_aria_label}".lower()
+                    combined_label = (
+                        f"{file_input_info['label']} {file_input_info['aria_label']}"
+                    ).lower()
 
                     # Skip if it's asking for a photo/image (not a resume/CV/document)
-                    photo_keywords = ["photo", "picture", "image", "headshot", "avatar"]
                     is_photo_field = any(
-                        keyword in combined_label for keyword in photo_keywords
+                        keyword in combined_label for keyword in PHOTO_UPLOAD_KEYWORDS
                     )
 
                     if is_photo_field:
@@ -571,29 +845,27 @@ Examples:
                             f"  ⚠️ Detected photo/image upload field - skipping (resume not applicable)"
                         )
                         print(f"     Field label: {combined_label}")
+                    elif not resume_available:
+                        print("  ⚠️ Resume file missing - skipping upload")
                     else:
                         # Check if there's already a file selected
                         # Look for file name display elements near the file input
-                        file_display_selectors = [
-                            f'text="{resume_filename}"',
-                            f'[class*="file"][class*="name"]:has-text("{resume_filename}")',
-                            f'[class*="upload"]:has-text("{resume_filename}")',
-                        ]
-
-                        already_uploaded = False
-                        for selector in file_display_selectors:
-                            if page.locator(selector).count() > 0:
-                                print(
-                                    f"  ✓ Resume already uploaded ({resume_filename}) - skipping"
-                                )
-                                already_uploaded = True
-                                break
-
-                        if not already_uploaded:
+                        if resume_display.count() > 0:
+                            print(
+                                f"  ✓ Resume already uploaded ({RESUME_FILENAME}) - skipping"
+                            )
+                        else:
                             print("  Uploading resume...")
-                            resume_inputs.first.set_input_files(resume_path)
+                            file_input.set_input_files(get_resume_payload())
                             print("  ✓ Resume uploaded")
-                            page.wait_for_timeout(500)
+                            # Same 500ms ceiling as before, but returns as
+                            # soon as the uploaded file name renders
+                            try:
+                                resume_display.first.wait_for(
+                                    state="attached", timeout=500
+                                )
+                            except:
+                                pass
 
                 except Exception as e:
                     print(f"  ⚠️ Resume upload handling failed: {e}")
@@ -613,7 +885,8 @@ Examples:
 
                     print(f"\n  Radio Group: {group_name}")
                     print(f"    Question: {question_text}")
-                    print(f"    Options ({option_count}): {', '.join(option_labels)}")
+                    if config.VERBOSE:
+                        print(f"    Options ({option_count}): {', '.join(option_labels)}")
 
                     # Extract job_id for debug logging
                     job_id = (
@@ -634,8 +907,9 @@ Examples:
                         job_url=job_url,
                     )
 
-                    print(f"    Matched Key: {matched_key}")
-                    print(f"    Confidence: {confidence}")
+                    if config.VERBOSE:
+                        print(f"    Matched Key: {matched_key}")
+                        print(f"    Confidence: {confidence}")
 
                     if answer is not None and confidence == "high":
                         # Determine target index based on answer type
@@ -730,9 +1004,7 @@ Examples:
 
                         # Log to file
                         log_entry = {
-                            "timestamp": datetime.now(
-                                ZoneInfo("America/Detroit")
-                            ).isoformat(),
+                            "timestamp": timestamp(),
                             "job_url": job_url,
                             "state": "RADIO_RESOLUTION",
                             "group_name": group_name,
@@ -746,8 +1018,7 @@ Examples:
                             ),
                             "confidence": confidence,
                         }
-                        with open("log.jsonl", "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        log_event(log_entry)
                     else:
                         # Low confidence - pause
                         print(f"    ⚠️ Low confidence - cannot resolve question")
@@ -755,9 +1026,7 @@ Examples:
 
                         # Log unresolved radio
                         log_entry = {
-                            "timestamp": datetime.now(
-                                ZoneInfo("America/Detroit")
-                            ).isoformat(),
+                            "timestamp": timestamp(),
                             "job_url": job_url,
                             "state": "RADIO_UNRESOLVED",
                             "group_name": group_name,
@@ -766,8 +1035,7 @@ Examples:
                             "confidence": confidence,
                             "reason": matched_key,
                         }
-                        with open("log.jsonl", "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        log_event(log_entry)
 
                 except Exception as e:
                     print(f"  ⚠️ Error with radio group: {e}")
@@ -821,7 +1089,8 @@ Examples:
 
                     print(f"\n  Radio-Equivalent Checkbox Group:")
                     print(f"    Question: {question}")
-                    print(f"    Options ({option_count}): {', '.join(option_labels)}")
+                    if config.VERBOSE:
+                        print(f"    Options ({option_count}): {', '.join(option_labels)}")
 
                     # Extract job_id for debug logging
                     job_id = (
@@ -842,8 +1111,9 @@ Examples:
                         job_url=job_url,
                     )
 
-                    print(f"    Matched Key: {matched_key}")
-                    print(f"    Confidence: {confidence}")
+                    if config.VERBOSE:
+                        print(f"    Matched Key: {matched_key}")
+                        print(f"    Confidence: {confidence}")
 
                     if answer is not None and confidence == "high":
                         # Determine target index
@@ -871,7 +1141,9 @@ Examples:
                         # Uncheck all checkboxes in group first
                         for cb_data in checkboxes_in_group:
                             cb = cb_data["element"]
-                            if cb.is_checked():
+                            # State from the detection snapshot - nothing in
+                            # this group has been toggled yet
+                            if cb_data["checked"]:
                                 cb.focus()
                                 human_delay(
                                     config.TIMING["focus_delay_min"],
@@ -908,9 +1180,7 @@ Examples:
 
                         # Log resolution
                         log_entry = {
-                            "timestamp": datetime.now(
-                                ZoneInfo("America/Detroit")
-                            ).isoformat(),
+                            "timestamp": timestamp(),
                             "job_url": job_url,
                             "state": "RADIO_EQUIVALENT_RESOLUTION",
                             "question": question,
@@ -920,8 +1190,7 @@ Examples:
                             "confidence": confidence,
                             "classification": "RADIO_EQUIVALENT",
                         }
-                        with open("log.jsonl", "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        log_event(log_entry)
                     else:
                         # Low confidence - cannot resolve
                         print(
@@ -930,9 +1199,7 @@ Examples:
                         radio_needs_pause = True
 
                         log_entry = {
-                            "timestamp": datetime.now(
-                                ZoneInfo("America/Detroit")
-                            ).isoformat(),
+                            "timestamp": timestamp(),
                             "job_url": job_url,
                             "state": "RADIO_EQUIVALENT_UNRESOLVED",
                             "question": question,
@@ -941,8 +1208,7 @@ Examples:
                             "reason": matched_key,
                             "classification": "RADIO_EQUIVALENT",
                         }
-                        with open("log.jsonl", "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        log_event(log_entry)
 
             # Handle standard checkboxes (consent, acknowledgements, etc.)
             if standard_checkboxes:
@@ -952,7 +1218,7 @@ Examples:
                     label_text = cb_data["label"]
 
                     try:
-                        is_already_checked = checkbox.is_checked()
+                        is_already_checked = cb_data["checked"]
                         print(
                             f"    Checkbox: {'[✓]' if is_already_checked else '[ ]'} {label_text[:60] if label_text else 'no label'}"
                         )
@@ -961,46 +1227,19 @@ Examples:
                             label_lower = label_text.lower()
 
                             # Categorize checkbox
-                            is_consent = any(
-                                word in label_lower
-                                for word in [
-                                    "agree",
-                                    "consent",
-                                    "terms",
-                                    "acknowledge",
-                                    "confirm",
-                                ]
-                            )
-                            is_communication = any(
-                                word in label_lower
-                                for word in [
-                                    "email",
-                                    "communication",
-                                    "updates",
-                                    "marketing",
-                                    "newsletter",
-                                    "inform",
-                                    "receive",
-                                ]
+                            is_consent = bool(CONSENT_CHECKBOX_RE.search(label_lower))
+                            is_communication = bool(
+                                COMMUNICATION_CHECKBOX_RE.search(label_lower)
                             )
 
                             # Check if required
                             is_required = False
                             checkbox_id = cb_data["id"]
                             if checkbox_id:
-                                required_marker = (
-                                    page.locator(
-                                        f'label[for="{checkbox_id}"] :has-text("*")'
-                                    ).count()
-                                    > 0
-                                )
-                                aria_required = (
-                                    checkbox.get_attribute("aria-required") == "true"
-                                )
                                 is_required = (
-                                    required_marker
+                                    cb_data["required_marker"]
                                     or "required" in label_lower
-                                    or aria_required
+                                    or cb_data["aria_required"]
                                 )
 
                             if is_consent or is_required:
@@ -1052,10 +1291,11 @@ Examples:
                     element = select_data["element"]
 
                     print(f"\n  Select Field {idx}: {label}")
-                    print(
-                        f"    Options ({option_count}): {', '.join(option_texts[:5])}{'...' if option_count > 5 else ''}"
-                    )
-                    print(f"    Current Value: {current_value}")
+                    if config.VERBOSE:
+                        print(
+                            f"    Options ({option_count}): {', '.join(option_texts[:5])}{'...' if option_count > 5 else ''}"
+                        )
+                        print(f"    Current Value: {current_value}")
 
                     # Extract job_id for debug logging
                     job_id = (
@@ -1072,8 +1312,9 @@ Examples:
                         job_url=job_url,
                     )
 
-                    print(f"    Matched Key: {matched_key}")
-                    print(f"    Confidence: {confidence}")
+                    if config.VERBOSE:
+                        print(f"    Matched Key: {matched_key}")
+                        print(f"    Confidence: {confidence}")
 
                     # Confidence requirements:
                     # - Self-ID fields: Allow medium OR high (safe "Decline" fallback)
@@ -1096,8 +1337,9 @@ Examples:
                     if can_proceed:
                         print(f"    Resolved Answer: Index {answer_index}")
 
-                        # Capture value before selection
-                        previous_value = element.input_value()
+                        # Value before selection, from the detection snapshot -
+                        # no other action has touched this select since
+                        previous_value = current_value
                         target_option_text = (
                             option_texts[answer_index]
                             if answer_index < len(option_texts)
@@ -1125,20 +1367,13 @@ Examples:
                                 )
                                 # For native <select>, set the value directly
                                 if target_option_value:
-                                    element.evaluate(
-                                        f"""(el) => {{
-                                        el.value = '{target_option_value}';
-                                        el.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                                        el.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                                    }}"""
-                                    )
-                                    human_delay(
-                                        config.TIMING["dropdown_open_min"],
-                                        config.TIMING["dropdown_open_max"],
+                                    # Value passed as an argument, not spliced
+                                    # into the script, so quotes are safe
+                                    new_value = element.evaluate(
+                                        _SET_SELECT_VALUE_JS, target_option_value
                                     )
 
                                     # Verify selection - check if current value matches target
-                                    new_value = element.input_value()
                                     if new_value == target_option_value:
                                         selection_succeeded = True
                                         strategy_used = "native_value_assignment"
@@ -1301,9 +1536,7 @@ Examples:
 
                         # Log to file
                         log_entry = {
-                            "timestamp": datetime.now(
-                                ZoneInfo("America/Detroit")
-                            ).isoformat(),
+                            "timestamp": timestamp(),
                             "job_url": job_url,
                             "state": "SELECT_RESOLUTION",
                             "label": label,
@@ -1315,8 +1548,7 @@ Examples:
                                 strategy_used if selection_succeeded else "all_failed"
                             ),
                         }
-                        with open("log.jsonl", "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        log_event(log_entry)
                     else:
                         # Low/medium confidence - pause with specific reason
                         if (
@@ -1336,9 +1568,7 @@ Examples:
 
                         # Log unresolved select
                         log_entry = {
-                            "timestamp": datetime.now(
-                                ZoneInfo("America/Detroit")
-                            ).isoformat(),
+                            "timestamp": timestamp(),
                             "job_url": job_url,
                             "state": "SELECT_UNRESOLVED",
                             "label": label,
@@ -1346,8 +1576,7 @@ Examples:
                             "confidence": confidence,
                             "reason": matched_key,
                         }
-                        with open("log.jsonl", "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        log_event(log_entry)
 
                 except Exception as e:
                     print(f"  ⚠️ Error with select field: {e}")
@@ -1384,22 +1613,26 @@ Examples:
 
             # STATE HANDLERS
             if state == "MODAL_TEXT_FIELD_DETECTED":
-                # Only process text fields once per step
-                if text_fields_processed:
-                    print(
-                        "\n⏭️  Text fields already processed this step, checking for navigation buttons..."
-                    )
-                    # Skip to button detection by continuing loop
-                    continue
-
+                # Only reached once per step - detect_state skips the text
+                # field scan after text_fields_processed is set
                 print("\n📝 Text field(s) detected in modal")
 
-                # Detect fields again to get metadata
-                text_fields = detect_text_fields_in_modal(page)
+                # Same scan detect_state made, unless the modal has changed
+                text_fields = modal_text_fields(page)
                 field_count = len(text_fields)
 
                 print(f"   Found {field_count} text input field(s) requiring input")
 
+                # Extract job_id for debug logging - same for every field
+                job_id = (
+                    job_url.split("/")[-2] if "/jobs/view/" in job_url else "unknown"
+                )
+
+                # Per-field log records and the unresolved tally, built as
+                # each field is handled
+                log_fields = []
+                unresolved_count = 0
+
                 # Process ALL text fields with semantic resolution
                 for idx, field in enumerate(text_fields, 1):
                     field_info = {
@@ -1409,24 +1642,20 @@ Examples:
                         "aria_label": field["aria_label"],
                         "placeholder": field["placeholder"],
                         "name": field["name"],
+                        "combined_text": field["combined_text"],
                     }
 
                     print(f"\n   Field {idx}/{field_count}:")
-                    print(f"     Tag: {field_info['tag']}")
-                    print(f"     Input Type: {field_info['input_type']}")
-                    print(f"     Label: {field_info['label']}")
-                    print(f"     Placeholder: {field_info['placeholder']}")
+                    if config.VERBOSE:
+                        print(f"     Tag: {field_info['tag']}")
+                        print(f"     Input Type: {field_info['input_type']}")
+                        print(f"     Label: {field_info['label']}")
+                        print(f"     Placeholder: {field_info['placeholder']}")
 
                     # CLASSIFY FIELD
                     classification = classify_field_type(field_info)
-                    print(f"     Classification: {classification}")
-
-                    # Extract job_id for debug logging
-                    job_id = (
-                        job_url.split("/")[-2]
-                        if "/jobs/view/" in job_url
-                        else "unknown"
-                    )
+                    if config.VERBOSE:
+                        print(f"     Classification: {classification}")
 
                     # RESOLVE ANSWER
                     resolved_value = resolve_field_answer(
@@ -1453,18 +1682,21 @@ Examples:
                     if value_to_type:
                         print(f"     Typing '{value_to_type}'...")
                         try:
-                            field["element"].focus()
-                            time.sleep(0.3)
-                            page.keyboard.press("Control+a")
-                            time.sleep(0.1)
-                            page.keyboard.type(
-                                value_to_type, delay=random.randint(50, 150)
-                            )
-                            time.sleep(0.3)
+                            # Only resolved answers reach here - fill() sets
+                            # the value and fires input in one call instead of
+                            # per-character keystrokes
+                            field["element"].fill(value_to_type)
                             print(f"     ✓ Typed '{value_to_type}'")
 
-                            # Check for inline validation errors after typing
-                            time.sleep(0.5)  # Give validation time to trigger
+                            # Check for inline validation errors after typing.
+                            # Same 500ms for validation to trigger, but an error
+                            # marks the field aria-invalid and ends the wait
+                            try:
+                                field["element"].and_(aria_invalid).wait_for(
+                                    state="attached", timeout=500
+                                )
+                            except:
+                                pass
                             has_error, error_text = detect_inline_validation_error(
                                 page, field["element"]
                             )
@@ -1477,9 +1709,7 @@ Examples:
 
                                 # Log validation error
                                 validation_log = {
-                                    "timestamp": datetime.now(
-                                        ZoneInfo("America/Detroit")
-                                    ).isoformat(),
+                                    "timestamp": timestamp(),
                                     "job_url": job_url,
                                     "state": "VALIDATION_ERROR",
                                     "field_label": field_info["label"],
@@ -1487,53 +1717,44 @@ Examples:
                                     "typed_value": value_to_type,
                                     "error_text": error_text,
                                 }
-                                with open("log.jsonl", "a") as f:
-                                    f.write(json.dumps(validation_log) + "\n")
+                                log_event(validation_log)
 
                         except Exception as e:
                             print(f"     ⚠️ Error typing: {e}")
                             needs_pause = True
 
                     # Track for logging
-                    field["classification"] = classification
-                    field["resolved_value"] = resolved_value
-                    field["typed_value"] = value_to_type
-                    field["needs_pause"] = needs_pause
+                    if needs_pause:
+                        unresolved_count += 1
+                    log_fields.append(
+                        {
+                            "label": field_info["label"],
+                            "placeholder": field_info["placeholder"],
+                            "type": field_info["input_type"],
+                            "classification": classification,
+                            "resolved_answer": resolved_value,
+                            "typed_value": value_to_type,
+                            "needs_pause": needs_pause,
+                        }
+                    )
 
                 # Check if ANY field needs pause
-                any_unresolved = any(f.get("needs_pause", False) for f in text_fields)
+                any_unresolved = unresolved_count > 0
 
                 # Log to file with enhanced metadata
                 log_entry = {
-                    "timestamp": datetime.now(ZoneInfo("America/Detroit")).isoformat(),
+                    "timestamp": timestamp(),
                     "job_url": job_url,
                     "state": "MODAL_TEXT_FIELD_DETECTED",
                     "action": "FIELD_RESOLUTION_ATTEMPTED",
                     "field_count": field_count,
-                    "fields": [
-                        {
-                            "label": f["label"],
-                            "placeholder": f["placeholder"],
-                            "type": f.get("input_type", "unknown"),
-                            "classification": f.get("classification", "UNKNOWN"),
-                            "resolved_answer": f.get("resolved_value"),
-                            "typed_value": f.get("typed_value"),
-                            "needs_pause": f.get("needs_pause", False),
-                        }
-                        for f in text_fields
-                    ],
+                    "fields": log_fields,
                 }
-                with open("log.jsonl", "a") as f:
-                    f.write(json.dumps(log_entry) + "\n")
+                log_event(log_entry)
 
                 if any_unresolved:
                     # Count resolved vs unresolved for CSV tracking
-                    resolved_count = sum(
-                        1 for f in text_fields if not f.get("needs_pause", False)
-                    )
-                    unresolved_count = sum(
-                        1 for f in text_fields if f.get("needs_pause", False)
-                    )
+                    resolved_count = field_count - unresolved_count
 
                     job_record["fields_resolved_count"] = resolved_count
                     job_record["fields_unresolved_count"] = unresolved_count
@@ -1642,21 +1863,9 @@ Examples:
                 print("\n✅ User confirmed - proceeding with submission...")
 
                 # Activate submit button using modal-scoped method
-                if activate_button_in_modal(page, "Submit"):
-                    page.wait_for_timeout(3000)
-
+                if activate_button_in_modal(page, "Submit", modal):
                     # Check for success indicators
-                    success_indicators = [
-                        'h3:has-text("Application sent")',
-                        'h2:has-text("Application sent")',
-                        ':has-text("Your application was sent")',
-                    ]
-
-                    success = False
-                    for indicator in success_indicators:
-                        if page.locator(indicator).count() > 0:
-                            success = True
-                            break
+                    success = wait_for_submit_success(visible_submit_success)
 
                     if success:
                         print("\n✅ APPLICATION SUBMITTED SUCCESSFULLY!")
@@ -1740,7 +1949,8 @@ Examples:
                 validation_errors_detected = False
                 error_messages = []
 
-                # Check for visible error messages
+                # Check for visible error messages - collected in-page in one
+                # round-trip instead of a count() and handle list per selector
                 error_selectors = [
                     '[role="dialog"] .artdeco-inline-feedback--error',
                     '[role="dialog"] [role="alert"]',
@@ -1748,24 +1958,21 @@ Examples:
                     '[role="dialog"] .fb-form-element-label__error',
                 ]
 
-                for err_sel in error_selectors:
-                    if page.locator(err_sel).count() > 0:
-                        errors = page.locator(err_sel).all()
-                        for error_el in errors:
-                            if error_el.is_visible():
-                                error_text = error_el.inner_text().strip()
-                                if error_text:
-                                    error_messages.append(error_text)
-                                    validation_errors_detected = True
+                error_messages = page.evaluate(
+                    """sel => Array.from(document.querySelectorAll(sel))
+                        .filter(el => el.getClientRects().length > 0
+                            && getComputedStyle(el).visibility !== "hidden")
+                        .map(el => el.innerText.trim())
+                        .filter(text => text)""",
+                    ", ".join(error_selectors),
+                )
+                if error_messages:
+                    validation_errors_detected = True
 
                 # Check for fields with aria-invalid=true
-                invalid_fields = page.locator(
-                    '[role="dialog"] input[aria-invalid="true"], [role="dialog"] select[aria-invalid="true"]'
-                ).all()
-                if invalid_fields:
-                    print(
-                        f"  ⚠️ Found {len(invalid_fields)} field(s) with validation errors"
-                    )
+                invalid_count = invalid_fields.count()
+                if invalid_count:
+                    print(f"  ⚠️ Found {invalid_count} field(s) with validation errors")
                     validation_errors_detected = True
 
                 if validation_errors_detected:
@@ -1806,8 +2013,10 @@ Examples:
                 print("   No validation errors detected - proceeding to next step...")
 
                 # Activate Next button using modal-scoped method
-                if activate_button_in_modal(page, "Next"):
-                    page.wait_for_timeout(2000)
+                modal_text = get_modal_text(page)
+                if activate_button_in_modal(page, "Next", modal):
+                    # Resolves as soon as the next step renders
+                    wait_for_modal_change(page, modal_text)
                     text_fields_processed = False  # Reset for next step
                     # Continue to next iteration
                     continue
@@ -1852,13 +2061,11 @@ Examples:
                 print("   Moving to review...")
 
                 # Try Review button first, then Submit
-                if activate_button_in_modal(page, "Review"):
-                    page.wait_for_timeout(2000)
+                modal_text = get_modal_text(page)
+                if activate_button_in_modal(page, "Review", modal):
+                    wait_for_modal_change(page, modal_text)
                     continue
-                elif (
-                    page.locator('[role="dialog"] button:has-text("Submit")').count()
-                    > 0
-                ):
+                elif modal_submit_button.count() > 0:
                     # TEST MODE: Skip submission, mark as test success
                     if test_mode:
                         print(
@@ -1920,21 +2127,11 @@ Examples:
 
                     print("\n✅ User confirmed - proceeding with submission...")
 
-                    if activate_button_in_modal(page, "Submit"):
-                        page.wait_for_timeout(3000)
-
                     # Check for success
-                    success_indicators = [
-                        'h3:has-text("Application sent")',
-                        'h2:has-text("Application sent")',
-                        ':has-text("Your application was sent")',
-                    ]
-
-                    success = False
-                    for indicator in success_indicators:
-                        if page.locator(indicator).count() > 0:
-                            success = True
-                            break
+                    if activate_button_in_modal(page, "Submit", modal):
+                        success = wait_for_submit_success(visible_submit_success)
+                    else:
+                        success = submit_success.count() > 0
 
                     if success:
                         print("\n✅ APPLICATION SUBMITTED SUCCESSFULLY!")
@@ -2085,7 +2282,7 @@ Examples:
 
         counts = Counter(batch_results)
 
-        print(f"\nProcessed {len(job_urls)} jobs:")
+        print(f"\nProcessed {len(batch_results)} jobs:")
         for status in [
             "SUCCESS",
             "TEST_SUCCESS",
@@ -2104,7 +2301,11 @@ Examples:
             # Create results directory if it doesn't exist
             os.makedirs("results", exist_ok=True)
 
-            csv_filename = f"results/job_results_{datetime.now(ZoneInfo('America/Detroit')).strftime('%Y%m%d_%H%M%S')}.csv"
+            csv_filename = f"results/job_results_{datetime.now(LOG_TZ).strftime('%Y%m%d_%H%M%S')}"
+            if args.shard:
+                # Parallel shards can finish in the same second
+                csv_filename += f"_shard{args.shard[0]}of{args.shard[1]}"
+            csv_filename += ".csv"
 
             fieldnames = [
                 "timestamp",
@@ -2136,7 +2337,7 @@ Examples:
             # Create results directory if it doesn't exist
             os.makedirs("results", exist_ok=True)
 
-            csv_filename = f"results/job_results_{datetime.now(ZoneInfo('America/Detroit')).strftime('%Y%m%d_%H%M%S')}.csv"
+            csv_filename = f"results/job_results_{datetime.now(LOG_TZ).strftime('%Y%m%d_%H%M%S')}.csv"
 
             fieldnames = [
                 "timestamp",
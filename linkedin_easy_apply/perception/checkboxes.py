@@ -1,5 +1,52 @@
 """Checkbox detection and classification"""
 
+# Per-checkbox metadata for the whole modal in one round-trip. The container
+# walk looks for the enclosing fieldset or form group and its question text
+_CHECKBOX_METADATA_JS = """() => {
+    const boxes = document.querySelectorAll('[role="dialog"] input[type="checkbox"]');
+    return Array.from(boxes, el => {
+        const label = el.id
+            ? document.querySelector(`label[for="${CSS.escape(el.id)}"]`)
+            : null;
+
+        let current = el;
+        // Look for parent fieldset or form group
+        while (current && current.tagName !== 'FIELDSET') {
+            if (current.classList &&
+                (current.classList.contains('fb-form-element') ||
+                 current.classList.contains('form-group') ||
+                 current.getAttribute('role') === 'group')) {
+                break;
+            }
+            current = current.parentElement;
+        }
+
+        let question = '';
+        let containerId = 'default';
+        if (current) {
+            // Get question text from legend or label
+            const legend = current.querySelector('legend');
+            const groupLabel = legend ? null : current.querySelector('label:not([for])');
+            const questionEl = legend || groupLabel;
+            if (questionEl) {
+                question = questionEl.textContent.trim();
+                containerId = current.id || current.className;
+            }
+        }
+
+        return {
+            id: el.id,
+            label: label ? label.innerText.trim() : '',
+            checked: el.checked,
+            ariaRequired: el.getAttribute('aria-required') === 'true',
+            requiredMarker: !!label && Array.from(label.querySelectorAll('*'))
+                .some(child => child.textContent.includes('*')),
+            question: question,
+            containerId: containerId,
+        };
+    });
+}"""
+
 
 def detect_checkbox_groups(page):
     """
@@ -18,77 +65,36 @@ def detect_checkbox_groups(page):
         standard_checkboxes = []
 
         checkboxes = page.locator('[role="dialog"] input[type="checkbox"]')
-        checkbox_count = checkboxes.count()
 
-        if checkbox_count == 0:
+        # One in-page pass reads every checkbox's label, state and container
+        checkbox_infos = page.evaluate(_CHECKBOX_METADATA_JS)
+
+        if not checkbox_infos:
             return {"radio_equivalent": [], "standard_checkboxes": []}
 
         # Group checkboxes by their parent container
         checkbox_groups = {}
 
-        for i in range(checkbox_count):
-            checkbox = checkboxes.nth(i)
-            checkbox_id = checkbox.get_attribute("id") or f"checkbox_{i}"
-
-            # Get label text
-            label_text = ""
-            label_elem = page.locator(f'label[for="{checkbox_id}"]')
-            if label_elem.count() > 0:
-                label_text = label_elem.first.inner_text().strip()
-
-            # Try to find parent question container
-            try:
-                parent_info = checkbox.evaluate(
-                    """el => {
-                    let current = el;
-                    // Look for parent fieldset or form group
-                    while (current && current.tagName !== 'FIELDSET') {
-                        if (current.classList && 
-                            (current.classList.contains('fb-form-element') || 
-                             current.classList.contains('form-group') ||
-                             current.getAttribute('role') === 'group')) {
-                            break;
-                        }
-                        current = current.parentElement;
-                    }
-                    
-                    if (current) {
-                        // Get question text from legend or label
-                        const legend = current.querySelector('legend');
-                        if (legend) return {
-                            question: legend.textContent.trim(),
-                            containerId: current.id || current.className
-                        };
-                        
-                        const groupLabel = current.querySelector('label:not([for])');
-                        if (groupLabel) return {
-                            question: groupLabel.textContent.trim(),
-                            containerId: current.id || current.className
-                        };
-                    }
-                    return {question: '', containerId: 'default'};
-                }"""
-                )
-
-                question_text = parent_info.get("question", "")
-                container_id = parent_info.get("containerId", "default")
-            except:
-                question_text = ""
-                container_id = "default"
+        for i, info in enumerate(checkbox_infos):
+            checkbox_id = info["id"] or f"checkbox_{i}"
+            container_id = info["containerId"]
 
             # Group by container
             if container_id not in checkbox_groups:
                 checkbox_groups[container_id] = {
-                    "question": question_text,
+                    "question": info["question"],
                     "checkboxes": [],
                 }
 
             checkbox_groups[container_id]["checkboxes"].append(
                 {
-                    "element": checkbox,
+                    "element": checkboxes.nth(i),
                     "id": checkbox_id,
-                    "label": label_text,
+                    "label": info["label"],
                     "index": i,
+                    "checked": info["checked"],
+                    "aria_required": info["ariaRequired"],
+                    "required_marker": info["requiredMarker"],
                 }
             )
 
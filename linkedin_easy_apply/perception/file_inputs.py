@@ -0,0 +1,25 @@
+"""File input detection"""
+
+# Read in-page so presence and label come back together - there is no window
+# for a modal re-render between a count() and the attribute reads
+_DETECT_FILE_INPUT_JS = """() => {
+    const input = document.querySelector('input[type="file"]');
+    if (!input) return null;
+    const label = input.id
+        ? document.querySelector(`label[for="${CSS.escape(input.id)}"]`)
+        : null;
+    return {
+        id: input.id,
+        aria_label: input.getAttribute("aria-label") || "",
+        label: label ? label.innerText : "",
+    };
+}"""
+
+
+def detect_file_input(page):
+    """
+    Return metadata for the first file input, or None if there is none.
+
+    Returns dict with keys: id, aria_label, label
+    """
+    return page.evaluate(_DETECT_FILE_INPUT_JS)
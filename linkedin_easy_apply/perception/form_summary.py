@@ -0,0 +1,29 @@
+"""Form element summary for the initial modal analysis"""
+
+# Counted in-page so the whole summary is one round-trip. Button matching
+# mirrors Playwright's :has-text() - case-insensitive substring of the text
+_COUNT_FORM_ELEMENTS_JS = """() => {
+    const count = sel => document.querySelectorAll(sel).length;
+    const buttons = Array.from(document.querySelectorAll("button"))
+        .map(btn => btn.textContent.toLowerCase());
+    const withText = text => buttons.filter(t => t.includes(text)).length;
+    return {
+        resume_upload: count('input[type="file"]'),
+        next: withText("next"),
+        review: withText("review"),
+        submit: withText("submit"),
+        text_inputs: count('input[type="text"], input[type="number"], textarea'),
+        selects: count("select"),
+        radios: count('input[type="radio"]'),
+    };
+}"""
+
+
+def count_form_elements(page):
+    """
+    Count the form elements used to decide whether a form is present.
+
+    Returns dict with keys: resume_upload, next, review, submit,
+    text_inputs, selects, radios
+    """
+    return page.evaluate(_COUNT_FORM_ELEMENTS_JS)
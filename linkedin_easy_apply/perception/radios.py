@@ -1,5 +1,41 @@
 """Radio button detection"""
 
+# Every group's question and option labels in one round-trip. Groups come back
+# in document order of their first radio, options in document order within
+# the group so index j lines up with the group locator's nth(j). Question text
+# lookup order: fieldset legend/label, first option's label, aria-label
+_RADIO_GROUPS_JS = """() => {
+    const dialogLabel = id => id
+        ? document.querySelector(`[role="dialog"] label[for="${CSS.escape(id)}"]`)
+        : null;
+    const groups = new Map();
+    for (const radio of document.querySelectorAll('[role="dialog"] input[type="radio"]')) {
+        const name = radio.getAttribute("name");
+        if (!name) continue;
+        if (!groups.has(name)) groups.set(name, []);
+        groups.get(name).push(radio);
+    }
+    return Array.from(groups, ([name, radios]) => {
+        const fieldset = radios[0].closest("fieldset");
+        const fieldsetText = fieldset
+            ? fieldset.querySelector("legend") || fieldset.querySelector("label")
+            : null;
+        let question = fieldsetText ? fieldsetText.textContent.trim() : "";
+        if (!question) {
+            const label = dialogLabel(radios[0].id);
+            question = label ? label.innerText.trim() : "";
+        }
+        if (!question) {
+            question = (radios[0].getAttribute("aria-label") || "").trim();
+        }
+        const labels = radios.map((radio, j) => {
+            const label = dialogLabel(radio.id);
+            return label ? label.innerText.trim() : `Option ${j + 1}`;
+        });
+        return { name, question, labels };
+    });
+}"""
+
 
 def detect_radio_groups(page):
     """
@@ -8,85 +44,22 @@ def detect_radio_groups(page):
     """
     try:
         radio_groups_data = []
-        processed_names = set()
-
-        radios = page.locator('[role="dialog"] input[type="radio"]')
-        radio_count = radios.count()
-
-        for i in range(radio_count):
-            radio = radios.nth(i)
-            name = radio.get_attribute("name")
 
-            if not name or name in processed_names:
-                continue
+        for group in page.evaluate(_RADIO_GROUPS_JS):
+            name = group["name"]
 
-            processed_names.add(name)
-
-            # Get all radios in this group
+            # Locator for acting on the group later - building it costs no
+            # round-trip until it is used
             group_radios = page.locator(
                 f'[role="dialog"] input[type="radio"][name="{name}"]'
             )
-            option_count = group_radios.count()
-
-            # Extract question text from label/legend/fieldset
-            question_text = ""
-
-            # Try to find parent fieldset/legend
-            try:
-                parent_fieldset = radio.evaluate(
-                    """el => {
-                    let current = el;
-                    while (current && current.tagName !== 'FIELDSET') {
-                        current = current.parentElement;
-                    }
-                    if (current) {
-                        const legend = current.querySelector('legend');
-                        if (legend) return legend.textContent;
-                        const label = current.querySelector('label');
-                        if (label) return label.textContent;
-                    }
-                    return '';
-                }"""
-                )
-                if parent_fieldset:
-                    question_text = parent_fieldset.strip()
-            except:
-                pass
-
-            # If no fieldset, try first radio's label
-            if not question_text:
-                radio_id = group_radios.first.get_attribute("id")
-                if radio_id:
-                    label = page.locator(f'[role="dialog"] label[for="{radio_id}"]')
-                    if label.count() > 0:
-                        question_text = label.first.inner_text().strip()
-
-            # If still no question, try aria-label
-            if not question_text:
-                aria_label = radio.get_attribute("aria-label")
-                if aria_label:
-                    question_text = aria_label.strip()
-
-            # Get option labels
-            option_labels = []
-            for j in range(option_count):
-                opt_radio = group_radios.nth(j)
-                opt_id = opt_radio.get_attribute("id")
-                if opt_id:
-                    opt_label = page.locator(f'[role="dialog"] label[for="{opt_id}"]')
-                    if opt_label.count() > 0:
-                        option_labels.append(opt_label.first.inner_text().strip())
-                    else:
-                        option_labels.append(f"Option {j+1}")
-                else:
-                    option_labels.append(f"Option {j+1}")
 
             radio_groups_data.append(
                 {
                     "name": name,
-                    "question_text": question_text,
-                    "option_count": option_count,
-                    "option_labels": option_labels,
+                    "question_text": group["question"],
+                    "option_count": len(group["labels"]),
+                    "option_labels": group["labels"],
                     "radios": group_radios,
                 }
             )
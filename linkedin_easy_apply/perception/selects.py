@@ -1,8 +1,89 @@
 """Select dropdown detection"""
 
-from linkedin_easy_apply.reasoning.normalize import normalize_text
+import re
+from linkedin_easy_apply.reasoning.normalize import (
+    normalize_text,
+    normalize_option_text,
+)
 from linkedin_easy_apply.utils.timing import human_delay
 
+# Patterns to SKIP - these are auto-fillable
+SELECT_SKIP_PATTERNS = (
+    "phone",
+    "mobile",
+    "telephone",
+    "country code",
+    "area code",  # Phone related
+    "email",
+    "e-mail",
+    "email address",  # Email related
+    "country",
+    "state",
+    "province",
+    "region",  # Location (often auto-filled)
+    "prefix",
+    "suffix",  # Name prefix/suffix
+    "first name",
+    "last name",  # Name fields
+)
+
+# Normalized skip patterns in one alternation, longest first so the reported
+# match is the most specific one
+_NORMALIZED_SKIP_PATTERNS = sorted(
+    map(normalize_text, SELECT_SKIP_PATTERNS), key=len, reverse=True
+)
+SELECT_SKIP_RE = re.compile("|".join(map(re.escape, _NORMALIZED_SKIP_PATTERNS)))
+
+# Visibility, identity and label text for every select in the modal, in
+# document order so index i lines up with locator.nth(i). Label lookup order:
+# label[for=id] within the select's dialog, aria-label, then the enclosing
+# field-level wrapper (fieldset or [data-test-form-element]) or nearest
+# ancestor with >= 10 characters of text. Broader "*form*" containers are not
+# used - they can span the whole step and pull in other questions' text
+_SELECTS_METADATA_JS = """() => {
+    const formElementSel = "fieldset, [data-test-form-element]";
+    const labelFor = el => {
+        // Label lookup scoped to the select's own dialog root rather than a
+        // document-wide '[role="dialog"] label[for=...]' selector
+        const dialog = el.closest('[role="dialog"]');
+        const label = el.id
+            ? dialog.querySelector(`label[for="${CSS.escape(el.id)}"]`)
+            : null;
+        let text = label ? label.innerText.trim() : "";
+        if (!text) text = (el.getAttribute("aria-label") || "").trim();
+        if (!text) {
+            // A field-level wrapper is the usual answer; the innerText walk
+            // is only the fallback, as each read forces layout
+            let p = el.closest(formElementSel);
+            if (!p || p.innerText.length < 10) {
+                p = el.parentElement;
+                while (p && (!p.innerText || p.innerText.length < 10)) {
+                    p = p.parentElement;
+                }
+            }
+            text = p ? p.innerText.trim() : "";
+        }
+        return text;
+    };
+    return Array.from(document.querySelectorAll('[role="dialog"] select'), el => ({
+        visible: el.getClientRects().length > 0
+            && getComputedStyle(el).visibility !== "hidden",
+        disabled: el.disabled,
+        id: el.id || null,
+        name: el.getAttribute("name") || "",
+        label: labelFor(el),
+    }));
+}"""
+
+# [text, value] for each option plus the current value, for one select
+_SELECT_OPTIONS_JS = """el => ({
+    options: Array.from(el.options, o => [
+        o.innerText.trim(),
+        o.getAttribute("value") || "",
+    ]),
+    value: el.value,
+})"""
+
 
 def detect_select_fields(page):
     """
@@ -10,85 +91,32 @@ def detect_select_fields(page):
     Returns list of select field metadata dicts.
     """
     try:
-        # Patterns to SKIP - these are auto-fillable
-        skip_patterns = [
-            "phone",
-            "mobile",
-            "telephone",
-            "country code",
-            "area code",  # Phone related
-            "email",
-            "e-mail",
-            "email address",  # Email related
-            "country",
-            "state",
-            "province",
-            "region",  # Location (often auto-filled)
-            "prefix",
-            "suffix",  # Name prefix/suffix
-            "first name",
-            "last name",  # Name fields
-        ]
-
         select_fields = []
         selects = page.locator('[role="dialog"] select')
-        select_count = selects.count()
 
-        for i in range(select_count):
-            select = selects.nth(i)
+        # Identity and label for every select in one round-trip; options are
+        # read after the focus below so lazy-loaded ones are included
+        select_infos = page.evaluate(_SELECTS_METADATA_JS)
+        for i, info in enumerate(select_infos):
 
             # Skip if disabled or hidden
-            if not select.is_visible() or select.is_disabled():
+            if not info["visible"] or info["disabled"]:
                 continue
 
-            # Get label
-            label_text = ""
-            select_id = select.get_attribute("id")
-            if select_id:
-                label = page.locator(f'[role="dialog"] label[for="{select_id}"]')
-                if label.count() > 0:
-                    label_text = label.first.inner_text().strip()
-
-            # Get aria-label fallback
-            if not label_text:
-                aria_label = select.get_attribute("aria-label")
-                if aria_label:
-                    label_text = aria_label.strip()
-
-            # If still no label, extract from parent container
-            if not label_text:
-                try:
-                    parent_text = select.evaluate(
-                        """el => {
-                        let p = el.parentElement;
-                        while (p && (!p.innerText || p.innerText.length < 10)) {
-                            p = p.parentElement;
-                        }
-                        return p ? p.innerText : '';
-                    }"""
-                    )
-                    if parent_text:
-                        label_text = parent_text.strip()
-                except:
-                    pass
+            select = selects.nth(i)
+            label_text = info["label"]
+            select_id = info["id"]
 
             # Check if this select should be skipped
-            should_skip = False
-            select_name = select.get_attribute("name") or ""
+            select_name = info["name"]
             # Normalize and combine all identifying text (handles newlines, extra spaces)
             text_to_check = normalize_text(f"{label_text} {select_name} {select_id}")
 
-            for pattern in skip_patterns:
-                # Also normalize the pattern for consistent matching
-                normalized_pattern = normalize_text(pattern)
-                if normalized_pattern in text_to_check:
-                    should_skip = True
-                    print(
-                        f"  ⏭️  Skipping auto-fillable select: {label_text or select_name} (matched: {pattern})"
-                    )
-                    break
-
-            if should_skip:
+            skip_match = SELECT_SKIP_RE.search(text_to_check)
+            if skip_match:
+                print(
+                    f"  ⏭️  Skipping auto-fillable select: {label_text or select_name} (matched: {skip_match.group(0)})"
+                )
                 continue
 
             # Focus the select to ensure lazy-loaded options populate
@@ -98,30 +126,30 @@ def detect_select_fields(page):
             except:
                 pass
 
-            # Get options (re-query after focus)
-            options = select.locator("option")
-            option_count = options.count()
+            # Get options and the selected value (re-read after focus)
+            state = select.evaluate(_SELECT_OPTIONS_JS)
             option_texts = []
             option_values = []
 
-            for j in range(option_count):
-                opt = options.nth(j)
-                opt_text = opt.inner_text().strip()
-                opt_value = opt.get_attribute("value") or ""
+            for opt_text, opt_value in state["options"]:
                 if opt_text:  # Skip empty options
                     option_texts.append(opt_text)
                     option_values.append(opt_value)
 
-            # Get currently selected value
-            current_value = select.input_value()
+            current_value = state["value"]
 
             select_fields.append(
                 {
                     "element": select,
                     "label": label_text,
+                    "label_normalized": normalize_text(label_text),
                     "option_count": len(option_texts),
                     "option_texts": option_texts,
                     "option_values": option_values,
+                    # Normalized once here for resolve_select_answer's matching
+                    "option_texts_normalized": [
+                        normalize_option_text(t) for t in option_texts
+                    ],
                     "current_value": current_value,
                 }
             )
@@ -1,110 +1,139 @@
 """Text field detection and validation"""
 
+import re
+
+# Metadata for every matching field in one round-trip, in document order so
+# index i lines up with locator.nth(i). Visibility mirrors Playwright's
+# is_visible(): a non-empty box and not visibility:hidden. selector is a
+# stable id selector when the field has an id, so later actions resolve one
+# element directly instead of re-running the union query for nth(i)
+_FIELDS_METADATA_JS = """sel => Array.from(document.querySelectorAll(sel), el => {
+    const label = el.id
+        ? document.querySelector(`label[for="${CSS.escape(el.id)}"]`)
+        : null;
+    return {
+        visible: el.getClientRects().length > 0
+            && getComputedStyle(el).visibility !== "hidden",
+        disabled: el.disabled,
+        value: el.value || "",
+        id: el.id || "",
+        selector: el.id ? `[role="dialog"] #${CSS.escape(el.id)}` : null,
+        name: el.getAttribute("name") || "",
+        placeholder: el.getAttribute("placeholder") || "",
+        aria_label: el.getAttribute("aria-label") || "",
+        label: label ? label.innerText.trim() : "",
+        tag: el.tagName.toLowerCase(),
+        type: el.getAttribute("type"),
+    };
+})"""
+
+
+# Text-like inputs, scoped to the modal container only
+TEXT_FIELD_SEL = ", ".join(
+    [
+        '[role="dialog"] input[type="text"]',
+        '[role="dialog"] input[type="number"]',
+        '[role="dialog"] input[type="date"]',
+        '[role="dialog"] textarea',
+    ]
+)
+
+# Fields to SKIP - these are auto-fillable or optional
+SKIP_PATTERNS = (
+    "phone",
+    "mobile",
+    "telephone",
+    "cell",
+    "phone number",  # Phone fields
+    "email",
+    "e-mail",
+    "email address",  # Email fields
+    "address",
+    "street",
+    "city",
+    "zip",
+    "postal",
+    "country",  # Address fields
+    "linkedin",
+    "website",
+    "url",
+    "portfolio",  # Social/web links
+    "first name",
+    "last name",
+    "full name",  # Name fields (auto-filled)
+    "prefix",
+    "suffix",  # Name prefix/suffix
+)
+
+# All skip patterns in one alternation, longest first so the reported match
+# is the most specific one
+SKIP_PATTERN_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(SKIP_PATTERNS, key=len, reverse=True))
+)
+
 
 def detect_text_fields_in_modal(page):
     """Detect visible text input fields inside Easy Apply modal only"""
     try:
-        # Scope detection to modal container only
-        modal_selector = '[role="dialog"]'
-
-        # Find all text-like inputs within the modal
-        field_selectors = [
-            f'{modal_selector} input[type="text"]',
-            f'{modal_selector} input[type="number"]',
-            f'{modal_selector} input[type="date"]',
-            f"{modal_selector} textarea",
-        ]
-
-        # Fields to SKIP - these are auto-fillable or optional
-        skip_patterns = [
-            "phone",
-            "mobile",
-            "telephone",
-            "cell",
-            "phone number",  # Phone fields
-            "email",
-            "e-mail",
-            "email address",  # Email fields
-            "address",
-            "street",
-            "city",
-            "zip",
-            "postal",
-            "country",  # Address fields
-            "linkedin",
-            "website",
-            "url",
-            "portfolio",  # Social/web links
-            "first name",
-            "last name",
-            "full name",  # Name fields (auto-filled)
-            "prefix",
-            "suffix",  # Name prefix/suffix
-        ]
-
         detected_fields = []
 
-        for selector in field_selectors:
-            fields = page.locator(selector)
-            count = fields.count()
-
-            for i in range(count):
-                field = fields.nth(i)
-
-                # Skip if disabled or hidden
-                if not field.is_visible() or field.is_disabled():
-                    continue
-
-                # Skip if field already has a value (already filled)
-                current_value = field.input_value()
-                if current_value and current_value.strip():
-                    continue
-
-                # Extract metadata
-                field_id = field.get_attribute("id") or ""
-                field_name = field.get_attribute("name") or ""
-                placeholder = field.get_attribute("placeholder") or ""
-                aria_label = field.get_attribute("aria-label") or ""
-
-                # Try to find associated label
-                label_text = ""
-                if field_id:
-                    label = page.locator(f'label[for="{field_id}"]')
-                    if label.count() > 0:
-                        label_text = label.first.inner_text().strip()
-
-                # Determine field type
-                tag_name = field.evaluate("el => el.tagName").lower()
-                input_type = (
-                    field.get_attribute("type") if tag_name == "input" else "textarea"
-                )
-
-                # Check if this field should be skipped
-                should_skip = False
-                text_to_check = f"{field_id} {field_name} {label_text} {placeholder} {aria_label}".lower()
-
-                for pattern in skip_patterns:
-                    if pattern in text_to_check:
-                        should_skip = True
-                        print(
-                            f"  ⏭️  Skipping auto-fillable field: {label_text or placeholder or field_name} (matched: {pattern})"
-                        )
-                        break
-
-                if should_skip:
-                    continue
-
-                detected_fields.append(
-                    {
-                        "element": field,
-                        "tag": tag_name,
-                        "input_type": input_type,
-                        "label": label_text,
-                        "aria_label": aria_label,
-                        "placeholder": placeholder,
-                        "name": field_name,
-                    }
+        # One union selector, in document order - visibility is checked in the
+        # metadata script rather than with a :visible pseudo-class
+        fields = page.locator(TEXT_FIELD_SEL)
+
+        # Every field's attributes in a single round-trip; a locator is only
+        # attached to fields that survive the filters below
+        field_infos = page.evaluate(_FIELDS_METADATA_JS, TEXT_FIELD_SEL)
+        for index, info in enumerate(field_infos):
+
+            # Skip if disabled or hidden
+            if not info["visible"] or info["disabled"]:
+                continue
+
+            # Skip if field already has a value (already filled)
+            if info["value"].strip():
+                continue
+
+            # Extract metadata
+            field_id = info["id"]
+            field_name = info["name"]
+            placeholder = info["placeholder"]
+            aria_label = info["aria_label"]
+            label_text = info["label"]
+
+            # Determine field type
+            tag_name = info["tag"]
+            input_type = info["type"] if tag_name == "input" else "textarea"
+
+            # Check if this field should be skipped
+            text_to_check = f"{field_id} {field_name} {label_text} {placeholder} {aria_label}".lower()
+
+            skip_match = SKIP_PATTERN_RE.search(text_to_check)
+            if skip_match:
+                print(
+                    f"  ⏭️  Skipping auto-fillable field: {label_text or placeholder or field_name} (matched: {skip_match.group(0)})"
                 )
+                continue
+
+            # Bind by id where possible; positional fallback otherwise
+            if info["selector"]:
+                element = page.locator(info["selector"])
+            else:
+                element = fields.nth(index)
+
+            detected_fields.append(
+                {
+                    "element": element,
+                    "tag": tag_name,
+                    "input_type": input_type,
+                    "label": label_text,
+                    "aria_label": aria_label,
+                    "placeholder": placeholder,
+                    "name": field_name,
+                    # Lowercased once here for classify/resolve keyword matching
+                    "combined_text": f"{label_text} {placeholder} {aria_label}".lower(),
+                }
+            )
 
         return detected_fields
 
@@ -113,44 +142,50 @@ def detect_text_fields_in_modal(page):
         return []
 
 
+# Returns null when the field is valid, otherwise the first non-empty error text
+# ("" when none is found). Lookup order: aria-describedby target, then
+# "<id>-error" and the common error classes inside the dialog
+_INLINE_ERROR_JS = """el => {
+    if (el.getAttribute("aria-invalid") !== "true") return null;
+
+    const visible = e => e.getClientRects().length > 0
+        && getComputedStyle(e).visibility !== "hidden";
+    const textOf = e => (e ? e.innerText.trim() : "");
+
+    const describedBy = el.getAttribute("aria-describedby");
+    if (describedBy) {
+        const text = textOf(document.getElementById(describedBy));
+        if (text) return text;
+    }
+
+    const byId = document.getElementById(`${el.id}-error`);
+    const candidates = [
+        byId && byId.closest('[role="dialog"]') ? byId : null,
+        document.querySelector('[role="dialog"] .error-message'),
+        document.querySelector('[role="dialog"] .field-error'),
+        document.querySelector('[role="dialog"] [class*="error"][class*="text"]'),
+    ];
+    for (const candidate of candidates) {
+        if (candidate && visible(candidate)) {
+            const text = textOf(candidate);
+            if (text) return text;
+        }
+    }
+    return "";
+}"""
+
+
 def detect_inline_validation_error(page, field_element):
     """
     Detect inline validation errors near a field.
     Returns: (has_error: bool, error_text: str)
     """
     try:
-        # Check if field has aria-invalid
-        aria_invalid = field_element.get_attribute("aria-invalid")
-        if aria_invalid == "true":
-            # Try to find error message
-            field_id = field_element.get_attribute("id") or ""
-
-            # Look for aria-describedby error message
-            aria_describedby = field_element.get_attribute("aria-describedby")
-            if aria_describedby:
-                error_el = page.locator(f"#{aria_describedby}")
-                if error_el.count() > 0:
-                    error_text = error_el.first.inner_text().strip()
-                    if error_text:
-                        return (True, error_text)
-
-            # Look for nearby error elements (common patterns)
-            error_selectors = [
-                f'[role="dialog"] [id="{field_id}-error"]',
-                f'[role="dialog"] .error-message',
-                f'[role="dialog"] .field-error',
-                f'[role="dialog"] [class*="error"][class*="text"]',
-            ]
-
-            for selector in error_selectors:
-                error_el = page.locator(selector)
-                if error_el.count() > 0 and error_el.first.is_visible():
-                    error_text = error_el.first.inner_text().strip()
-                    if error_text:
-                        return (True, error_text)
-
-            return (True, "Validation error (no error text found)")
-
-        return (False, "")
+        error_text = field_element.evaluate(_INLINE_ERROR_JS)
+        if error_text is None:
+            return (False, "")
+        if error_text:
+            return (True, error_text)
+        return (True, "Validation error (no error text found)")
     except Exception as e:
         return (False, "")
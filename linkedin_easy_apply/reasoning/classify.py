@@ -1,5 +1,36 @@
 """Field classification logic"""
 
+import re
+from linkedin_easy_apply.reasoning.normalize import combined_field_text
+
+# Keyword patterns for the generic date/numeric rules, each compiled into one
+# alternation. Plain substrings (no word boundaries) like the original checks
+DATE_KEYWORDS = (
+    "date",
+    "when",
+    "start date",
+    "end date",
+    "availability",
+    "available",
+    "begin",
+    "commence",
+)
+NUMERIC_KEYWORDS = (
+    "year",
+    "years",
+    "yrs",
+    "experience",
+    "month",
+    "months",
+    "salary",
+    "compensation",
+    "notice period",
+    "notice",
+    "gpa",
+)
+_DATE_KEYWORD_RE = re.compile("|".join(map(re.escape, DATE_KEYWORDS)))
+_NUMERIC_KEYWORD_RE = re.compile("|".join(map(re.escape, NUMERIC_KEYWORDS)))
+
 
 def classify_field_type(field_metadata):
     """
@@ -11,12 +42,9 @@ def classify_field_type(field_metadata):
     Classification order matters: Tier-1 → Tier-2 → Numeric → Date → Text → Unknown
     """
     input_type = field_metadata.get("input_type", "").lower()
-    label = field_metadata.get("label", "").lower()
-    placeholder = field_metadata.get("placeholder", "").lower()
-    aria_label = field_metadata.get("aria_label", "").lower()
 
-    # Combine all text for keyword matching
-    combined_text = f"{label} {placeholder} {aria_label}"
+    # Combined text for keyword matching, lowercased once at detection time
+    combined_text = combined_field_text(field_metadata)
 
     # TIER-1 CLASSIFICATION (checked first - highest priority)
     # These must be explicitly identified before falling through to generic handling
@@ -160,39 +188,12 @@ def classify_field_type(field_metadata):
         return "DATE_FIELD"
 
     # RULE 2: Keyword patterns for date fields
-    date_keywords = [
-        "date",
-        "when",
-        "start date",
-        "end date",
-        "availability",
-        "available",
-        "begin",
-        "commence",
-    ]
-
-    for keyword in date_keywords:
-        if keyword in combined_text:
-            return "DATE_FIELD"
+    if _DATE_KEYWORD_RE.search(combined_text):
+        return "DATE_FIELD"
 
     # RULE 3: Keyword patterns for numeric fields
-    numeric_keywords = [
-        "year",
-        "years",
-        "yrs",
-        "experience",
-        "month",
-        "months",
-        "salary",
-        "compensation",
-        "notice period",
-        "notice",
-        "gpa",
-    ]
-
-    for keyword in numeric_keywords:
-        if keyword in combined_text:
-            return "NUMERIC_FIELD"
+    if _NUMERIC_KEYWORD_RE.search(combined_text):
+        return "NUMERIC_FIELD"
 
     # RULE 4: Textarea is always text
     if field_metadata.get("tag") == "textarea":
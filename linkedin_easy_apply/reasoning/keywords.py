@@ -0,0 +1,42 @@
+"""Keyword-tuple mapping lookup"""
+
+import re
+
+
+def build_keyword_index(mappings):
+    """
+    Precompute lookup structures for a (keywords_tuple, key) mapping table.
+
+    Mappings keep their priority order - the index only narrows which rows
+    need a full check. Returns dict with keys: mappings, candidates,
+    any_keyword_re
+    """
+    # keyword -> indices of the rows that use it, in priority order
+    candidates = {}
+    for row, (keywords, _) in enumerate(mappings):
+        for kw in keywords:
+            candidates.setdefault(kw, []).append(row)
+
+    return {
+        "mappings": mappings,
+        "candidates": candidates,
+        # Rejects text containing no keyword at all in one C-level scan
+        "any_keyword_re": re.compile(
+            "|".join(re.escape(kw) for kw in sorted(candidates, key=len, reverse=True))
+        ),
+    }
+
+
+def match_first(index, text):
+    """Return the key of the first mapping whose keywords all occur in text"""
+    if not index["any_keyword_re"].search(text):
+        return None
+
+    # Substring test per distinct keyword, then only the rows those hit
+    present = {kw for kw in index["candidates"] if kw in text}
+    rows = sorted({row for kw in present for row in index["candidates"][kw]})
+    for row in rows:
+        keywords, bank_key = index["mappings"][row]
+        if present.issuperset(keywords):
+            return bank_key
+    return None
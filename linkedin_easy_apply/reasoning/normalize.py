@@ -1,32 +1,46 @@
 """Text normalization utilities"""
 
+import re
 import string
+from functools import lru_cache
 
+# Built once - str.maketrans is otherwise rebuilt on every call
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
 
+# Filler words stripped from option text, in the original removal order
+_FILLER_RE = re.compile("weeks|months|please select|select one|choose|pick")
+
+
+# Labels and keyword patterns repeat heavily across radios and options, so
+# results are memoized - both functions are pure and take str arguments
+@lru_cache(maxsize=4096)
 def normalize_text(text):
     """Normalize text for keyword matching - lowercase, strip punctuation"""
     if not text:
         return ""
-    # Lowercase and remove punctuation
-    text = text.lower()
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    # Collapse whitespace
-    return " ".join(text.split())
+    # Lowercase, remove punctuation and collapse whitespace
+    return " ".join(text.lower().translate(_PUNCT_TABLE).split())
 
 
+@lru_cache(maxsize=4096)
 def normalize_option_text(text):
     """Normalize dropdown option text for matching - removes filler words"""
     if not text:
         return ""
-    # Lowercase
-    text = text.lower()
-    # Remove punctuation
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    # Collapse whitespace
-    text = " ".join(text.split())
-    # Remove filler words
-    filler_words = ["weeks", "months", "please select", "select one", "choose", "pick"]
-    for filler in filler_words:
-        text = text.replace(filler, "")
-    # Re-collapse whitespace after removals
-    return " ".join(text.split())
+    # Lowercase, remove punctuation and collapse whitespace
+    text = " ".join(text.lower().translate(_PUNCT_TABLE).split())
+    # Remove filler words, then re-collapse whitespace after removals
+    return " ".join(_FILLER_RE.sub("", text).split())
+
+
+def combined_field_text(field_metadata):
+    """Lowercased "label placeholder aria_label" text used for keyword matching"""
+    combined = field_metadata.get("combined_text")
+    if combined is None:
+        # Metadata built outside detect_text_fields_in_modal - compute it here
+        combined = (
+            f"{field_metadata.get('label', '')} "
+            f"{field_metadata.get('placeholder', '')} "
+            f"{field_metadata.get('aria_label', '')}"
+        ).lower()
+    return combined
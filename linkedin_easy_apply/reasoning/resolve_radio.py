@@ -1,9 +1,178 @@
 """Radio button resolution logic"""
 
 from linkedin_easy_apply.data.answer_bank import ANSWER_BANK, USER_ASSERTIONS
+from linkedin_easy_apply.reasoning.keywords import build_keyword_index, match_first
 from linkedin_easy_apply.reasoning.normalize import normalize_text
 
 
+# Keyword mappings for boolean questions
+# Format: (keywords_tuple, answer_bank_key)
+# Patterns are ordered from most specific to least specific
+# Each pattern should uniquely identify the question type to avoid false matches
+BOOLEAN_MAPPINGS = (
+    # Work authorization - require both keywords to avoid matching unrelated "work" questions
+    (("authorized", "work"), "authorized_to_work"),
+    (("legally", "authorized"), "authorized_to_work"),
+    (("legal", "right", "work"), "authorized_to_work"),
+    (("work", "authorization"), "authorized_to_work"),
+    # Sponsorship - "require" + "sponsorship" is highly specific
+    # "now or future" pattern catches common phrasing variations
+    (("require", "sponsorship"), "requires_sponsorship"),
+    (("need", "sponsorship"), "requires_sponsorship"),
+    (("visa", "sponsorship"), "requires_sponsorship"),
+    (("sponsorship", "now", "future"), "requires_sponsorship"),
+    # Relocation - "willing" is key discriminator
+    (("willing", "relocate"), "willing_to_relocate"),
+    (("open", "relocation"), "willing_to_relocate"),
+    (("willing", "move"), "willing_to_relocate"),
+    # Background check - both words required to avoid false match
+    (("background", "check"), "background_check_consent"),
+    (("criminal", "background"), "background_check_consent"),
+    (("background", "screening"), "background_check_consent"),
+    # Drug test - both words required
+    (("drug", "test"), "drug_test_consent"),
+    (("drug", "screen"), "drug_test_consent"),
+    # Age / legal eligibility - specific age or explicit "legal age"
+    (("over", "18"), "over_18"),
+    (("18", "years"), "over_18"),
+    (("legal", "age"), "over_18"),
+    (("legally", "eligible", "work"), "legally_eligible"),
+    # Reasonable accommodation - essential job functions
+    # "reasonable accommodation" + "essential functions" is highly specific
+    (
+        ("reasonable", "accommodation", "essential", "functions"),
+        "reasonable_accommodation_essential_functions",
+    ),
+    (
+        ("with", "without", "accommodation", "perform"),
+        "reasonable_accommodation_essential_functions",
+    ),
+    # Driver's license requirement
+    # "driver's license" or "valid license" + "provide proof" or "required"
+    (("driver", "license", "proof"), "drivers_license_proof"),
+    (("valid", "license", "employment"), "drivers_license_proof"),
+    (("driver", "license", "required"), "drivers_license_proof"),
+)
+_BOOLEAN_INDEX = build_keyword_index(BOOLEAN_MAPPINGS)
+
+
+def _normalize_patterns(patterns_by_pref):
+    """Normalize every option pattern once, at import time"""
+    return {
+        pref: tuple(normalize_text(pattern) for pattern in patterns)
+        for pref, patterns in patterns_by_pref.items()
+    }
+
+
+# Multi-option self-identification questions, checked in order.
+# Format: (question keywords, answer_bank_key, {preference: option patterns},
+# exact) - exact patterns must equal the option text, others are substrings
+SELF_ID_DISPATCH = (
+    # Gender question (typically 3 options: Male, Female, Decline)
+    # Exact match so "male" does not select "Female"
+    (
+        ("gender", "sex"),
+        "gender",
+        _normalize_patterns(
+            {
+                "male": ["male"],
+                "female": ["female"],
+                "decline": [
+                    "decline",
+                    "prefer not to answer",
+                    "i don't wish to answer",
+                    "decline to answer",
+                ],
+            }
+        ),
+        True,
+    ),
+    # Race/Ethnicity question
+    (
+        ("race", "ethnicity", "ethnic"),
+        "race",
+        _normalize_patterns(
+            {
+                "white": ["white", "caucasian"],
+                "black": ["black", "african american", "african-american"],
+                "hispanic": ["hispanic", "latino", "latina", "latinx"],
+                "asian": ["asian"],
+                "native_american": [
+                    "native american",
+                    "american indian",
+                    "alaska native",
+                ],
+                "pacific_islander": ["pacific islander", "native hawaiian"],
+                "two_or_more": ["two or more", "two or more races", "multiracial"],
+                "decline": [
+                    "decline",
+                    "prefer not to answer",
+                    "i don't wish to answer",
+                    "decline to answer",
+                ],
+            }
+        ),
+        False,
+    ),
+    # Veteran status question
+    (
+        ("veteran", "military", "armed forces"),
+        "veteran_status",
+        _normalize_patterns(
+            {
+                "veteran": [
+                    "i identify as one or more",
+                    "i am a veteran",
+                    "yes, i am a veteran",
+                    "protected veteran",
+                ],
+                "not_veteran": [
+                    "i am not a protected veteran",
+                    "i am not a veteran",
+                    "no, i am not a veteran",
+                    "not a protected veteran",
+                ],
+                "decline": [
+                    "decline",
+                    "prefer not to answer",
+                    "i don't wish to answer",
+                    "i do not wish to answer",
+                    "decline to self identify",
+                ],
+            }
+        ),
+        False,
+    ),
+    # Disability status question
+    (
+        ("disability", "disabled", "impairment"),
+        "disability_status",
+        _normalize_patterns(
+            {
+                "yes_disability": [
+                    "yes, i have a disability",
+                    "yes i have",
+                    "i have a disability",
+                ],
+                "no_disability": [
+                    "no, i don't have a disability",
+                    "no i do not",
+                    "i do not have a disability",
+                    "no disability",
+                ],
+                "decline": [
+                    "decline",
+                    "prefer not to answer",
+                    "i don't wish to answer",
+                    "decline to self identify",
+                ],
+            }
+        ),
+        False,
+    ),
+)
+
+
 def resolve_radio_question(
     page,
     group_name,
@@ -100,61 +269,8 @@ def resolve_radio_question(
 
     # BINARY QUESTIONS (2 options only) - Boolean True/False
     if option_count == 2:
-        # Keyword mappings for boolean questions
-        # Format: (keywords_tuple): answer_bank_key
-        # Patterns are ordered from most specific to least specific
-        # Each pattern should uniquely identify the question type to avoid false matches
-        boolean_mappings = [
-            # Work authorization - require both keywords to avoid matching unrelated "work" questions
-            (("authorized", "work"), "authorized_to_work"),
-            (("legally", "authorized"), "authorized_to_work"),
-            (("legal", "right", "work"), "authorized_to_work"),
-            (("work", "authorization"), "authorized_to_work"),
-            # Sponsorship - "require" + "sponsorship" is highly specific
-            # "now or future" pattern catches common phrasing variations
-            (("require", "sponsorship"), "requires_sponsorship"),
-            (("need", "sponsorship"), "requires_sponsorship"),
-            (("visa", "sponsorship"), "requires_sponsorship"),
-            (("sponsorship", "now", "future"), "requires_sponsorship"),
-            # Relocation - "willing" is key discriminator
-            (("willing", "relocate"), "willing_to_relocate"),
-            (("open", "relocation"), "willing_to_relocate"),
-            (("willing", "move"), "willing_to_relocate"),
-            # Background check - both words required to avoid false match
-            (("background", "check"), "background_check_consent"),
-            (("criminal", "background"), "background_check_consent"),
-            (("background", "screening"), "background_check_consent"),
-            # Drug test - both words required
-            (("drug", "test"), "drug_test_consent"),
-            (("drug", "screen"), "drug_test_consent"),
-            # Age / legal eligibility - specific age or explicit "legal age"
-            (("over", "18"), "over_18"),
-            (("18", "years"), "over_18"),
-            (("legal", "age"), "over_18"),
-            (("legally", "eligible", "work"), "legally_eligible"),
-            # Reasonable accommodation - essential job functions
-            # "reasonable accommodation" + "essential functions" is highly specific
-            (
-                ("reasonable", "accommodation", "essential", "functions"),
-                "reasonable_accommodation_essential_functions",
-            ),
-            (
-                ("with", "without", "accommodation", "perform"),
-                "reasonable_accommodation_essential_functions",
-            ),
-            # Driver's license requirement
-            # "driver's license" or "valid license" + "provide proof" or "required"
-            (("driver", "license", "proof"), "drivers_license_proof"),
-            (("valid", "license", "employment"), "drivers_license_proof"),
-            (("driver", "license", "required"), "drivers_license_proof"),
-        ]
-
         # Try to match keywords - first match wins (most specific first)
-        matched_key = None
-        for keywords, bank_key in boolean_mappings:
-            if all(kw in normalized for kw in keywords):
-                matched_key = bank_key
-                break
+        matched_key = match_first(_BOOLEAN_INDEX, normalized)
 
         if matched_key and matched_key in ANSWER_BANK:
             answer = ANSWER_BANK[matched_key]
@@ -328,146 +444,26 @@ def resolve_radio_question(
     # MULTI-OPTION QUESTIONS (3+ options) - Self-identification
     # These run AFTER Tier-1/Tier-2 citizenship questions
     if option_count >= 3:
-        # Gender question (typically 3 options: Male, Female, Decline)
-        if any(kw in normalized for kw in ["gender", "sex"]):
-            if "gender" in ANSWER_BANK:
-                gender_pref = ANSWER_BANK["gender"].lower()
-
-                # Map answer bank values to option text patterns
-                gender_patterns = {
-                    "male": ["male"],
-                    "female": ["female"],
-                    "decline": [
-                        "decline",
-                        "prefer not to answer",
-                        "i don't wish to answer",
-                        "decline to answer",
-                    ],
-                }
-
-                if gender_pref in gender_patterns:
-                    # Try to match option by text pattern
-                    for i, opt_label in enumerate(option_labels):
-                        opt_normalized = normalize_text(opt_label)
-                        for pattern in gender_patterns[gender_pref]:
-                            if normalize_text(pattern) == opt_normalized:
-                                return (i, "high", "gender")
-
-                    # No confident match - pause
-                    return (None, "low", "gender_no_option_match")
-
-        # Race/Ethnicity question
-        if any(kw in normalized for kw in ["race", "ethnicity", "ethnic"]):
-            if "race" in ANSWER_BANK:
-                race_pref = ANSWER_BANK["race"].lower()
-
-                # Map answer bank values to option text patterns
-                race_patterns = {
-                    "white": ["white", "caucasian"],
-                    "black": ["black", "african american", "african-american"],
-                    "hispanic": ["hispanic", "latino", "latina", "latinx"],
-                    "asian": ["asian"],
-                    "native_american": [
-                        "native american",
-                        "american indian",
-                        "alaska native",
-                    ],
-                    "pacific_islander": ["pacific islander", "native hawaiian"],
-                    "two_or_more": ["two or more", "two or more races", "multiracial"],
-                    "decline": [
-                        "decline",
-                        "prefer not to answer",
-                        "i don't wish to answer",
-                        "decline to answer",
-                    ],
-                }
-
-                if race_pref in race_patterns:
-                    # Try to match option by text pattern
-                    for i, opt_label in enumerate(option_labels):
-                        opt_normalized = normalize_text(opt_label)
-                        for pattern in race_patterns[race_pref]:
-                            if normalize_text(pattern) in opt_normalized:
-                                return (i, "high", "race")
-
-                    # No confident match - pause
-                    return (None, "low", "race_no_option_match")
-
-        # Veteran status question
-        if any(kw in normalized for kw in ["veteran", "military", "armed forces"]):
-            if "veteran_status" in ANSWER_BANK:
-                veteran_pref = ANSWER_BANK["veteran_status"].lower()
-
-                # Map answer bank values to option text patterns
-                veteran_patterns = {
-                    "veteran": [
-                        "i identify as one or more",
-                        "i am a veteran",
-                        "yes, i am a veteran",
-                        "protected veteran",
-                    ],
-                    "not_veteran": [
-                        "i am not a protected veteran",
-                        "i am not a veteran",
-                        "no, i am not a veteran",
-                        "not a protected veteran",
-                    ],
-                    "decline": [
-                        "decline",
-                        "prefer not to answer",
-                        "i don't wish to answer",
-                        "i do not wish to answer",
-                        "decline to self identify",
-                    ],
-                }
-
-                if veteran_pref in veteran_patterns:
-                    # Try to match option by text pattern
-                    for i, opt_label in enumerate(option_labels):
-                        opt_normalized = normalize_text(opt_label)
-                        for pattern in veteran_patterns[veteran_pref]:
-                            if normalize_text(pattern) in opt_normalized:
-                                return (i, "high", "veteran_status")
-
-                    # No confident match - pause
-                    return (None, "low", "veteran_status_no_option_match")
-
-        # Disability status question
-        if any(kw in normalized for kw in ["disability", "disabled", "impairment"]):
-            if "disability_status" in ANSWER_BANK:
-                disability_pref = ANSWER_BANK["disability_status"].lower()
-
-                # Map answer bank values to option text patterns
-                disability_patterns = {
-                    "yes_disability": [
-                        "yes, i have a disability",
-                        "yes i have",
-                        "i have a disability",
-                    ],
-                    "no_disability": [
-                        "no, i don't have a disability",
-                        "no i do not",
-                        "i do not have a disability",
-                        "no disability",
-                    ],
-                    "decline": [
-                        "decline",
-                        "prefer not to answer",
-                        "i don't wish to answer",
-                        "decline to self identify",
-                    ],
-                }
-
-                if disability_pref in disability_patterns:
-                    # Try to match option by text pattern
-                    for i, opt_label in enumerate(option_labels):
-                        opt_normalized = normalize_text(opt_label)
-                        for pattern in disability_patterns[disability_pref]:
-                            if normalize_text(pattern) in opt_normalized:
-                                return (i, "high", "disability_status")
-
-                    # No confident match - pause
-                    return (None, "low", "disability_status_no_option_match")
+        for triggers, bank_key, patterns_by_pref, exact in SELF_ID_DISPATCH:
+            if not any(kw in normalized for kw in triggers):
+                continue
+            if bank_key not in ANSWER_BANK:
+                continue
+            patterns = patterns_by_pref.get(ANSWER_BANK[bank_key].lower())
+            if patterns is None:
+                continue
+
+            # Try to match option by text pattern
+            for i, opt_label in enumerate(option_labels):
+                opt_normalized = normalize_text(opt_label)
+                for pattern in patterns:
+                    if pattern == opt_normalized or (
+                        not exact and pattern in opt_normalized
+                    ):
+                        return (i, "high", bank_key)
+
+            # No confident match - pause
+            return (None, "low", f"{bank_key}_no_option_match")
 
     # No confident match - record for debug if enabled
     if debug_unresolved and job_id and job_url:
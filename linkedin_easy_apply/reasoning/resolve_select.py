@@ -1,10 +1,148 @@
 """Select dropdown resolution logic"""
 
+import re
 from linkedin_easy_apply.data.answer_bank import ANSWER_BANK
 from linkedin_easy_apply.reasoning.normalize import (
     normalize_text,
     normalize_option_text,
 )
+from linkedin_easy_apply.reasoning.keywords import build_keyword_index, match_first
+
+# Keyword mappings for dropdown questions. Eligible dropdown types:
+# 1. Self-identification fields (EEO/diversity with "Decline" option)
+# 2. Start date/notice period (discrete time offsets only, no calendar dates)
+# 3. Education enrollment status (binary Yes/No only, current enrollment)
+# 4. Summer 2026 internship availability (May-August 2026 ONLY, always Yes)
+# Format: (keywords_tuple, answer_bank_key), first match wins
+SELECT_MAPPINGS = (
+    # Self-identification only (if presented as dropdowns instead of radios)
+    (("gender",), "gender"),
+    (("sex",), "gender"),
+    (("race",), "race"),
+    (("ethnicity",), "race"),
+    (("ethnic",), "race"),
+    (("veteran",), "veteran_status"),
+    (("disability",), "disability_status"),
+    (("disabled",), "disability_status"),
+    # Start date / notice period questions
+    # Only matches questions about availability timing, not specific dates
+    (("when", "start"), "start_date_notice_period"),
+    (("start", "date"), "start_date_notice_period"),
+    (("notice", "period"), "start_date_notice_period"),
+    (("how", "soon"), "start_date_notice_period"),
+    # Education enrollment status
+    # Only matches questions about CURRENT enrollment, not graduation dates or GPA
+    (("currently", "pursuing", "degree"), "education_enrollment_status"),
+    (("currently", "enrolled"), "education_enrollment_status"),
+    (("current", "student"), "education_enrollment_status"),
+    (("currently", "attending"), "education_enrollment_status"),
+    # Summer 2026 internship availability
+    # MUST explicitly mention May-August 2026 timeframe - no inference allowed
+    # This is checked BEFORE generic 'availability' to prevent false matches
+    (
+        ("available", "may", "august", "2026"),
+        "summer_2026_internship_availability",
+    ),
+    (
+        ("availability", "may", "august", "2026"),
+        "summer_2026_internship_availability",
+    ),
+    # Language proficiency level
+    # Matches questions about language skill level (beginner, intermediate, advanced, fluent, native)
+    (("language", "level"), "language_proficiency"),
+    (("language", "proficiency"), "language_proficiency"),
+    # Common pattern: "Select your level"
+    (("select", "level"), "language_proficiency"),
+    (("english", "level"), "language_proficiency"),
+    (("english", "proficiency"), "language_proficiency"),
+    # Job referral source / How did you hear about us
+    # Matches questions about where applicant learned about the job opening
+    (("where", "learned", "opening"), "referral_source"),
+    (("how", "hear", "about"), "referral_source"),
+    (("how", "find", "job"), "referral_source"),
+    (("referral", "source"), "referral_source"),
+    # Education level completed
+    # Matches questions about highest education level achieved
+    (("highest", "level", "education"), "education_level"),
+    (("highest", "education"), "education_level"),
+    (("education", "level", "completed"), "education_level"),
+    (("degree", "level"), "education_level"),
+)
+_SELECT_INDEX = build_keyword_index(SELECT_MAPPINGS)
+
+# Self-identification (EEO/diversity) fields - safe "Decline" fallback
+SELF_ID_KEYS = frozenset({"gender", "race", "veteran_status", "disability_status"})
+
+# Explicit eligibility: ONLY these dropdown types are ever auto-selected
+# - Self-identification fields (with safe "Decline" option)
+# - Start date/notice period (discrete time offsets only)
+# - Education enrollment status (binary Yes/No only)
+# - Summer 2026 internship availability (May-August 2026 only, always Yes)
+# - Language proficiency (standard levels: beginner to native)
+# - Referral source (how did you hear about us - select from predefined list)
+# - Education level (highest degree completed - select from standard education levels)
+ELIGIBLE_SELECT_TYPES = SELF_ID_KEYS | frozenset(
+    {
+        "start_date_notice_period",
+        "education_enrollment_status",
+        "summer_2026_internship_availability",
+        "language_proficiency",
+        "referral_source",
+        "education_level",
+    }
+)
+
+# Self-identification dropdowns: answer bank value -> option text keywords
+SELF_ID_OPTION_KEYWORDS = {
+    "gender": {
+        "male": ["male", "man"],
+        "female": ["female", "woman"],
+        "decline": ["decline", "prefer not", "rather not", "don't wish", "dont wish"],
+    },
+    "race": {
+        "white": ["white", "caucasian"],
+        "black": ["black", "african american", "african-american"],
+        "hispanic": ["hispanic", "latino", "latina", "latinx"],
+        "asian": ["asian", "asian american", "asian-american"],
+        "native_american": [
+            "native american",
+            "american indian",
+            "alaska native",
+            "indigenous",
+        ],
+        "pacific_islander": ["pacific islander", "native hawaiian"],
+        "two_or_more": ["two or more", "multiple", "multiracial"],
+        "decline": ["decline", "prefer not", "rather not", "don't wish", "dont wish"],
+    },
+    "veteran_status": {
+        "veteran": ["protected veteran", "i am", "i identify", "yes"],
+        "not_veteran": ["not a", "not protected", "i am not", "no"],
+        "decline": ["decline", "prefer not", "rather not", "don't wish", "dont wish"],
+    },
+    "disability_status": {
+        "yes_disability": ["yes", "i have", "have a disability", "have a"],
+        "no_disability": ["no", "not have", "don't have", "do not have"],
+        "decline": ["decline", "prefer not", "rather not", "don't wish", "dont wish"],
+    },
+}
+
+# matched_key reported when a "decline" answer falls back to the last option
+SELF_ID_LAST_OPTION_KEYS = {
+    "gender": "gender_last_option",
+    "race": "race_last_option",
+    "veteran_status": "veteran_last_option",
+    "disability_status": "disability_last_option",
+}
+
+# One alternation per (field, answer bank value), built from keywords
+# normalized the same way option text is - one search per option
+_SELF_ID_OPTION_RE = {
+    (key, value): re.compile(
+        "|".join(re.escape(normalize_option_text(kw)) for kw in keywords)
+    )
+    for key, keywords_by_value in SELF_ID_OPTION_KEYWORDS.items()
+    for value, keywords in keywords_by_value.items()
+}
 
 
 def resolve_select_answer(
@@ -32,110 +170,33 @@ def resolve_select_answer(
 
     Returns: (resolved_index: int|None, confidence: str, matched_key: str)
     """
-    label = select_metadata.get("label", "").lower()
-    option_count = select_metadata.get("option_count", 0)
-    option_texts = select_metadata.get("option_texts", [])
-    option_values = select_metadata.get("option_values", [])
-
-    normalized_label = normalize_text(label)
-
-    # Eligible dropdown types:
-    # 1. Self-identification fields (EEO/diversity with "Decline" option)
-    # 2. Start date/notice period (discrete time offsets only, no calendar dates)
-    # 3. Education enrollment status (binary Yes/No only, current enrollment)
-    # 4. Summer 2026 internship availability (May-August 2026 ONLY, always Yes)
-    select_mappings = {
-        # Self-identification only (if presented as dropdowns instead of radios)
-        ("gender",): "gender",
-        ("sex",): "gender",
-        ("race",): "race",
-        ("ethnicity",): "race",
-        ("ethnic",): "race",
-        ("veteran",): "veteran_status",
-        ("disability",): "disability_status",
-        ("disabled",): "disability_status",
-        # Start date / notice period questions
-        # Only matches questions about availability timing, not specific dates
-        ("when", "start"): "start_date_notice_period",
-        ("start", "date"): "start_date_notice_period",
-        ("notice", "period"): "start_date_notice_period",
-        ("how", "soon"): "start_date_notice_period",
-        # Education enrollment status
-        # Only matches questions about CURRENT enrollment, not graduation dates or GPA
-        ("currently", "pursuing", "degree"): "education_enrollment_status",
-        ("currently", "enrolled"): "education_enrollment_status",
-        ("current", "student"): "education_enrollment_status",
-        ("currently", "attending"): "education_enrollment_status",
-        # Summer 2026 internship availability
-        # MUST explicitly mention May-August 2026 timeframe - no inference allowed
-        # This is checked BEFORE generic 'availability' to prevent false matches
-        ("available", "may", "august", "2026"): "summer_2026_internship_availability",
-        (
-            "availability",
-            "may",
-            "august",
-            "2026",
-        ): "summer_2026_internship_availability",
-        # Language proficiency level
-        # Matches questions about language skill level (beginner, intermediate, advanced, fluent, native)
-        ("language", "level"): "language_proficiency",
-        ("language", "proficiency"): "language_proficiency",
-        (
-            "select",
-            "level",
-        ): "language_proficiency",  # Common pattern: "Select your level"
-        ("english", "level"): "language_proficiency",
-        ("english", "proficiency"): "language_proficiency",
-        # Job referral source / How did you hear about us
-        # Matches questions about where applicant learned about the job opening
-        ("where", "learned", "opening"): "referral_source",
-        ("how", "hear", "about"): "referral_source",
-        ("how", "find", "job"): "referral_source",
-        ("referral", "source"): "referral_source",
-        # Education level completed
-        # Matches questions about highest education level achieved
-        ("highest", "level", "education"): "education_level",
-        ("highest", "education"): "education_level",
-        ("education", "level", "completed"): "education_level",
-        ("degree", "level"): "education_level",
-    }
+    normalized_label = select_metadata.get("label_normalized")
+    if normalized_label is None:
+        normalized_label = normalize_text(select_metadata.get("label", ""))
 
-    # Try to match keywords
-    matched_key = None
-    for keywords, bank_key in select_mappings.items():
-        if all(kw in normalized_label for kw in keywords):
-            matched_key = bank_key
-            break
+    # Try to match keywords - first match wins
+    matched_key = match_first(_SELECT_INDEX, normalized_label)
 
     # Explicit eligibility check: ONLY allowed types
-    # - Self-identification fields (with safe "Decline" option)
-    # - Start date/notice period (discrete time offsets only)
-    # - Education enrollment status (binary Yes/No only)
-    # - Summer 2026 internship availability (May-August 2026 only, always Yes)
-    # - Language proficiency (standard levels: beginner to native)
-    # - Referral source (how did you hear about us - select from predefined list)
-    # - Education level (highest degree completed - select from standard education levels)
-    eligible_types = [
-        "gender",
-        "race",
-        "veteran_status",
-        "disability_status",
-        "start_date_notice_period",
-        "education_enrollment_status",
-        "summer_2026_internship_availability",
-        "language_proficiency",
-        "referral_source",
-        "education_level",
-    ]
-    if matched_key not in eligible_types:
+    if matched_key not in ELIGIBLE_SELECT_TYPES:
         return (None, "low", "unsupported_dropdown_type")
 
+    # Options are only read once the label matched an eligible type - most
+    # company-specific dropdowns return above without touching them
+    option_count = select_metadata.get("option_count", 0)
+    option_texts = select_metadata.get("option_texts", [])
+    option_values = select_metadata.get("option_values", [])
+    # Normalized once by detect_select_fields; computed here for other callers
+    option_texts_normalized = select_metadata.get("option_texts_normalized")
+    if option_texts_normalized is None:
+        option_texts_normalized = [normalize_option_text(t) for t in option_texts]
+
     # Option count limits vary by field type
     # Self-ID fields: up to 15 options
     # Referral source: up to 25 options (many job boards/sources)
     # Education level: up to 15 options (various degree types)
     # Language proficiency: up to 8 options
-    if matched_key in ["gender", "race", "veteran_status", "disability_status"]:
+    if matched_key in SELF_ID_KEYS:
         if option_count > 15:
             return (None, "low", "too_many_options")
     elif matched_key == "referral_source":
@@ -153,110 +214,20 @@ def resolve_select_answer(
         expected_value = ANSWER_BANK[matched_key]
 
         # Handle self-identification fields (match by keyword in option text)
-        if matched_key in ["gender", "race", "veteran_status", "disability_status"]:
-            # Map answer bank value to option text keywords
-            if matched_key == "gender":
-                gender_keywords = {
-                    "male": ["male", "man"],
-                    "female": ["female", "woman"],
-                    "decline": [
-                        "decline",
-                        "prefer not",
-                        "rather not",
-                        "don't wish",
-                        "dont wish",
-                    ],
-                }
-                if expected_value in gender_keywords:
-                    for i, opt_text in enumerate(option_texts):
-                        opt_normalized = normalize_option_text(opt_text)
-                        # Use phrase matching for more precision
-                        for kw in gender_keywords[expected_value]:
-                            if normalize_option_text(kw) in opt_normalized:
-                                return (i, "high", matched_key)
-                    # If no match found and it's decline, try last option
-                    if expected_value == "decline" and len(option_texts) > 0:
-                        return (len(option_texts) - 1, "medium", "gender_last_option")
-
-            elif matched_key == "race":
-                race_keywords = {
-                    "white": ["white", "caucasian"],
-                    "black": ["black", "african american", "african-american"],
-                    "hispanic": ["hispanic", "latino", "latina", "latinx"],
-                    "asian": ["asian", "asian american", "asian-american"],
-                    "native_american": [
-                        "native american",
-                        "american indian",
-                        "alaska native",
-                        "indigenous",
-                    ],
-                    "pacific_islander": ["pacific islander", "native hawaiian"],
-                    "two_or_more": ["two or more", "multiple", "multiracial"],
-                    "decline": [
-                        "decline",
-                        "prefer not",
-                        "rather not",
-                        "don't wish",
-                        "dont wish",
-                    ],
-                }
-                if expected_value in race_keywords:
-                    for i, opt_text in enumerate(option_texts):
-                        opt_normalized = normalize_option_text(opt_text)
-                        for kw in race_keywords[expected_value]:
-                            if normalize_option_text(kw) in opt_normalized:
-                                return (i, "high", matched_key)
-                    # If no match and it's decline, try last option
-                    if expected_value == "decline" and len(option_texts) > 0:
-                        return (len(option_texts) - 1, "medium", "race_last_option")
-
-            elif matched_key == "veteran_status":
-                veteran_keywords = {
-                    "veteran": ["protected veteran", "i am", "i identify", "yes"],
-                    "not_veteran": ["not a", "not protected", "i am not", "no"],
-                    "decline": [
-                        "decline",
-                        "prefer not",
-                        "rather not",
-                        "don't wish",
-                        "dont wish",
-                    ],
-                }
-                if expected_value in veteran_keywords:
-                    for i, opt_text in enumerate(option_texts):
-                        opt_normalized = normalize_option_text(opt_text)
-                        for kw in veteran_keywords[expected_value]:
-                            if normalize_option_text(kw) in opt_normalized:
-                                return (i, "high", matched_key)
-                    # If no match and it's decline, try last option
-                    if expected_value == "decline" and len(option_texts) > 0:
-                        return (len(option_texts) - 1, "medium", "veteran_last_option")
-
-            elif matched_key == "disability_status":
-                disability_keywords = {
-                    "yes_disability": ["yes", "i have", "have a disability", "have a"],
-                    "no_disability": ["no", "not have", "don't have", "do not have"],
-                    "decline": [
-                        "decline",
-                        "prefer not",
-                        "rather not",
-                        "don't wish",
-                        "dont wish",
-                    ],
-                }
-                if expected_value in disability_keywords:
-                    for i, opt_text in enumerate(option_texts):
-                        opt_normalized = normalize_option_text(opt_text)
-                        for kw in disability_keywords[expected_value]:
-                            if normalize_option_text(kw) in opt_normalized:
-                                return (i, "high", matched_key)
-                    # If no match and it's decline, try last option
-                    if expected_value == "decline" and len(option_texts) > 0:
-                        return (
-                            len(option_texts) - 1,
-                            "medium",
-                            "disability_last_option",
-                        )
+        if matched_key in SELF_ID_KEYS:
+            option_re = _SELF_ID_OPTION_RE.get((matched_key, expected_value))
+            if option_re is not None:
+                for i, opt_normalized in enumerate(option_texts_normalized):
+                    # Use phrase matching for more precision
+                    if option_re.search(opt_normalized):
+                        return (i, "high", matched_key)
+                # If no match found and it's decline, try last option
+                if expected_value == "decline" and len(option_texts) > 0:
+                    return (
+                        len(option_texts) - 1,
+                        "medium",
+                        SELF_ID_LAST_OPTION_KEYS[matched_key],
+                    )
 
             # If we got here, couldn't match self-identification option
             return (None, "low", "self_id_option_not_matched")
@@ -335,16 +306,14 @@ def resolve_select_answer(
 
             # Try exact match first
             if expected_weeks in time_offset_keywords:
-                for i, opt_text in enumerate(option_texts):
-                    opt_normalized = normalize_option_text(opt_text)
+                for i, opt_normalized in enumerate(option_texts_normalized):
                     for kw in time_offset_keywords[expected_weeks]:
                         if normalize_option_text(kw) in opt_normalized:
                             return (i, "high", matched_key)
 
             # Fallback: Try to find numeric match in option text
             # Only if expected value appears explicitly (e.g., "2" in "2 weeks")
-            for i, opt_text in enumerate(option_texts):
-                opt_normalized = normalize_option_text(opt_text)
+            for i, opt_normalized in enumerate(option_texts_normalized):
                 # Check if expected number appears with "week" or "month" nearby
                 if expected_weeks in opt_normalized and (
                     "week" in opt_normalized or "month" in opt_normalized
@@ -417,9 +386,7 @@ def resolve_select_answer(
             # Filter out placeholder options ("Select", "Choose", etc.)
             placeholder_patterns = ["select", "choose", "pick"]
 
-            for i, opt_text in enumerate(option_texts):
-                opt_normalized = normalize_option_text(opt_text)
-
+            for i, opt_normalized in enumerate(option_texts_normalized):
                 # Skip placeholder options
                 is_placeholder = any(p in opt_normalized for p in placeholder_patterns)
                 if is_placeholder:
@@ -479,9 +446,7 @@ def resolve_select_answer(
             yes_patterns = ["yes", "available", "i am available"]
             placeholder_patterns = ["select", "choose", "pick"]
 
-            for i, opt_text in enumerate(option_texts):
-                opt_normalized = normalize_option_text(opt_text)
-
+            for i, opt_normalized in enumerate(option_texts_normalized):
                 # Skip placeholder options
                 is_placeholder = any(p in opt_normalized for p in placeholder_patterns)
                 if is_placeholder:
@@ -534,9 +499,7 @@ def resolve_select_answer(
             placeholder_patterns = ["select", "choose", "pick", "select an option"]
 
             if expected_level in proficiency_keywords:
-                for i, opt_text in enumerate(option_texts):
-                    opt_normalized = normalize_option_text(opt_text)
-
+                for i, opt_normalized in enumerate(option_texts_normalized):
                     # Skip placeholder options
                     is_placeholder = any(
                         p in opt_normalized for p in placeholder_patterns
@@ -588,9 +551,7 @@ def resolve_select_answer(
             placeholder_patterns = ["select", "choose", "pick", "select an option"]
 
             if expected_source in source_keywords:
-                for i, opt_text in enumerate(option_texts):
-                    opt_normalized = normalize_option_text(opt_text)
-
+                for i, opt_normalized in enumerate(option_texts_normalized):
                     # Skip placeholder options
                     is_placeholder = any(
                         p in opt_normalized for p in placeholder_patterns
@@ -659,9 +620,7 @@ def resolve_select_answer(
             placeholder_patterns = ["select", "choose", "pick", "select an option"]
 
             if expected_level in education_keywords:
-                for i, opt_text in enumerate(option_texts):
-                    opt_normalized = normalize_option_text(opt_text)
-
+                for i, opt_normalized in enumerate(option_texts_normalized):
                     # Skip placeholder options
                     is_placeholder = any(
                         p in opt_normalized for p in placeholder_patterns
@@ -2,6 +2,32 @@
 
 from datetime import datetime, timedelta
 from linkedin_easy_apply.data.answer_bank import ANSWER_BANK
+from linkedin_easy_apply.reasoning.keywords import build_keyword_index, match_first
+from linkedin_easy_apply.reasoning.normalize import combined_field_text
+
+# Keyword → answer bank key mappings, in priority order (first full match wins)
+KEYWORD_MAPPINGS = (
+    # Numeric mappings
+    (("year", "experience"), "years_experience"),
+    (("years", "experience"), "years_experience"),
+    (("work experience",), "work_experience"),
+    (("total experience",), "total_experience"),
+    (("notice period", "week"), "notice_period_weeks"),
+    (("notice",), "notice_period"),
+    (("gpa",), "gpa"),
+    # Text mappings
+    (("linkedin", "url"), "linkedin_url"),
+    (("linkedin", "profile"), "linkedin_url"),
+    (("portfolio", "url"), "portfolio_url"),
+    (("portfolio", "website"), "portfolio_url"),
+    (("github",), "github_url"),
+    (("website",), "website"),
+    (("skills",), "skills_summary"),
+    (("why", "interested"), "why_interested"),
+    (("why", "want", "work"), "why_interested"),
+)
+
+_KEYWORD_INDEX = build_keyword_index(KEYWORD_MAPPINGS)
 
 
 def resolve_field_answer(
@@ -36,12 +62,8 @@ def resolve_field_answer(
         str: value to type into field
         None: if no confident match found (triggers pause/skip)
     """
-    label = field_metadata.get("label", "").lower()
-    placeholder = field_metadata.get("placeholder", "").lower()
-    aria_label = field_metadata.get("aria_label", "").lower()
-
-    # Combine for matching
-    combined_text = f"{label} {placeholder} {aria_label}"
+    # Combined text for matching, lowercased once at detection time
+    combined_text = combined_field_text(field_metadata)
 
     # TIER-1 FIELD RESOLUTION (highest priority, always safe)
 
@@ -100,34 +122,8 @@ def resolve_field_answer(
         future_date = datetime.now() + timedelta(days=30)
         return (future_date.strftime("%m/%d/%Y"), "high", "start_date")
 
-    # Keyword → answer bank key mappings
-    keyword_mappings = {
-        # Numeric mappings
-        ("year", "experience"): "years_experience",
-        ("years", "experience"): "years_experience",
-        ("work experience",): "work_experience",
-        ("total experience",): "total_experience",
-        ("notice period", "week"): "notice_period_weeks",
-        ("notice",): "notice_period",
-        ("gpa",): "gpa",
-        # Text mappings
-        ("linkedin", "url"): "linkedin_url",
-        ("linkedin", "profile"): "linkedin_url",
-        ("portfolio", "url"): "portfolio_url",
-        ("portfolio", "website"): "portfolio_url",
-        ("github",): "github_url",
-        ("website",): "website",
-        ("skills",): "skills_summary",
-        ("why", "interested"): "why_interested",
-        ("why", "want", "work"): "why_interested",
-    }
-
     # Try to match keywords
-    matched_key = None
-    for keywords, bank_key in keyword_mappings.items():
-        if all(kw in combined_text for kw in keywords):
-            matched_key = bank_key
-            break
+    matched_key = match_first(_KEYWORD_INDEX, combined_text)
 
     if matched_key and matched_key in ANSWER_BANK:
         answer = ANSWER_BANK[matched_key]
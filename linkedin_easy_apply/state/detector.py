@@ -1,9 +1,106 @@
 """State detection logic"""
 
-from linkedin_easy_apply.perception.text_fields import detect_text_fields_in_modal
+from linkedin_easy_apply.perception.text_fields import (
+    TEXT_FIELD_SEL,
+    detect_text_fields_in_modal,
+)
 
+# Cheap fingerprint of the open dialog - markup size, element count and
+# typed/checked input state - or null when no dialog is open. Spliced into
+# both scripts below so detect_state and modal_text_fields always agree
+_DOM_VERSION_FN = """dialog => dialog
+    ? [
+        dialog.innerHTML.length,
+        dialog.getElementsByTagName("*").length,
+        Array.from(dialog.querySelectorAll("input, textarea, select"),
+            el => `${el.value}|${el.checked}`).join("\\n"),
+    ].join(":")
+    : null"""
 
-def detect_state(page, step_number):
+# Every DOM signal detect_state needs, gathered in one round-trip.
+# Button matching mirrors the selectors it replaces:
+#   Submit - :has-text("Submit application"), :has-text("Submit"), [aria-label*="Submit"]
+#   Next   - :has-text("Next"), :has-text("Continue"), [aria-label*="Next"]
+#   Review - :has-text("Review"), [aria-label*="Review"]
+#   Success - :has-text("Application sent") in any element; body.innerText
+#             covers every rendered element and skips hidden text
+# dom_version is used to reuse the text-field scan.
+# has_text_inputs is a presence check for TEXT_FIELD_SEL so the full
+# text-field scan only runs when there is something to scan
+_STATE_SNAPSHOT_JS = (
+    """textFieldSel => {
+    const domVersion = """
+    + _DOM_VERSION_FN
+    + """;
+    const visible = el => el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== "hidden";
+    const dialog = document.querySelector('[role="dialog"]');
+    const buttons = Array.from(document.querySelectorAll('[role="dialog"] button'))
+        .map(btn => ({
+            text: btn.textContent.toLowerCase(),
+            aria: btn.getAttribute("aria-label") || "",
+        }));
+    const anyButton = (texts, aria) => buttons.some(
+        btn => texts.some(t => btn.text.includes(t)) || btn.aria.includes(aria)
+    );
+    return {
+        modal_visible: Array.from(document.querySelectorAll('[role="dialog"]')).some(visible),
+        has_submit: anyButton(["submit"], "Submit"),
+        has_next: anyButton(["next", "continue"], "Next"),
+        has_review: anyButton(["review"], "Review"),
+        has_success: (document.body ? document.body.innerText : "")
+            .toLowerCase().includes("application sent"),
+        has_easy_apply: document.querySelector('[aria-label*="Easy Apply"]') !== null,
+        has_text_inputs: document.querySelector(textFieldSel) !== null,
+        dom_version: domVersion(dialog),
+    };
+}"""
+)
+
+# Just the dom_version fingerprint, for checking whether the modal changed
+# since detect_state's text-field scan
+_DOM_VERSION_JS = (
+    """() => {
+    const domVersion = """
+    + _DOM_VERSION_FN
+    + """;
+    return domVersion(document.querySelector('[role="dialog"]'));
+}"""
+)
+
+# Last text-field scan, with the page and dom_version it was taken at. The
+# state loop often re-detects an unchanged modal, so the scan is reused
+_text_field_cache = {"page": None, "dom_version": None, "fields": []}
+
+
+def _text_fields_for(page, dom_version):
+    """Return text fields for the modal, rescanning only when it changed"""
+    if (
+        dom_version is not None
+        and _text_field_cache["page"] is page
+        and _text_field_cache["dom_version"] == dom_version
+    ):
+        return _text_field_cache["fields"]
+
+    fields = detect_text_fields_in_modal(page)
+    _text_field_cache.update(page=page, dom_version=dom_version, fields=fields)
+    return fields
+
+
+def modal_text_fields(page):
+    """
+    Text fields for the MODAL_TEXT_FIELD_DETECTED handler.
+    Reuses detect_state's scan unless the modal changed since (e.g. a radio
+    answer revealed a follow-up field), in which case it rescans.
+    """
+    try:
+        dom_version = page.evaluate(_DOM_VERSION_JS)
+    except:
+        dom_version = None
+    return _text_fields_for(page, dom_version)
+
+
+def detect_state(page, step_number, text_fields_done=False):
     """Detect current UI state based on DOM signals - NO ACTIONS, only detection
 
     State detection priority:
@@ -13,42 +110,21 @@ def detect_state(page, step_number):
 
     This ordering prevents infinite loops where filled text fields remain in DOM
     but navigation buttons indicate the page is ready to proceed.
+
+    text_fields_done skips step 3 when this step's fields were already
+    handled - the caller would not act on them again anyway.
     """
     try:
-        # Check for modal first (most specific)
-        modal_visible = page.locator('[role="dialog"]').is_visible()
+        snapshot = page.evaluate(_STATE_SNAPSHOT_JS, TEXT_FIELD_SEL)
 
-        if modal_visible:
+        # Check for modal first (most specific)
+        if snapshot["modal_visible"]:
             # PRIORITY 1: Check for navigation buttons FIRST
             # Navigation buttons indicate actionable state transitions
-            submit_selectors = [
-                'button:has-text("Submit application")',
-                'button[aria-label*="Submit"]',
-                'button:has-text("Submit")',
-            ]
-            next_selectors = [
-                'button:has-text("Next")',
-                'button[aria-label*="Next"]',
-                'button:has-text("Continue")',
-            ]
-            review_selectors = [
-                'button:has-text("Review")',
-                'button[aria-label*="Review"]',
-            ]
-
-            has_submit = any(
-                page.locator(f'[role="dialog"] {sel}').count() > 0
-                for sel in submit_selectors
-            )
-            has_next = any(
-                page.locator(f'[role="dialog"] {sel}').count() > 0
-                for sel in next_selectors
-            )
-            has_review = any(
-                page.locator(f'[role="dialog"] {sel}').count() > 0
-                for sel in review_selectors
-            )
-            has_success = page.locator(':has-text("Application sent")').count() > 0
+            has_submit = snapshot["has_submit"]
+            has_next = snapshot["has_next"]
+            has_review = snapshot["has_review"]
+            has_success = snapshot["has_success"]
 
             # Debug: Print detected buttons
             if step_number > 1:  # Skip first step to reduce noise
@@ -87,16 +163,18 @@ def detect_state(page, step_number):
             # PRIORITY 2: Check for text fields ONLY if no navigation buttons found
             # Text fields indicate incomplete page requiring user input
             # Note: Text fields may persist in DOM after filling, so they're lower priority
-            text_fields = detect_text_fields_in_modal(page)
-            if len(text_fields) > 0:
-                return "MODAL_TEXT_FIELD_DETECTED"
+            # Skipped outright when the modal has no text-like inputs at all,
+            # or when the caller already processed this step's text fields
+            if snapshot["has_text_inputs"] and not text_fields_done:
+                text_fields = _text_fields_for(page, snapshot["dom_version"])
+                if len(text_fields) > 0:
+                    return "MODAL_TEXT_FIELD_DETECTED"
 
             # No buttons or fields detected - modal is open but state unclear
             return "MODAL_OPEN"
 
         # Check for Easy Apply button on job page
-        easy_apply_exists = page.locator('[aria-label*="Easy Apply"]').count() > 0
-        if easy_apply_exists:
+        if snapshot["has_easy_apply"]:
             return "JOB_PAGE"
 
         return "ERROR"
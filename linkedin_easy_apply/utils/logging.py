@@ -1,14 +1,59 @@
 """Logging utilities"""
 
+import atexit
 import json
-from datetime import datetime, timezone
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
+# orjson is optional - faster serialization when installed, stdlib otherwise
+try:
+    import orjson
+
+    def dumps_line(entry):
+        """Serialize one log entry as a JSONL line"""
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE).decode()
+
+except ImportError:
+
+    def dumps_line(entry):
+        """Serialize one log entry as a JSONL line"""
+        return json.dumps(entry, separators=(",", ":")) + "\n"
+
+
+LOG_FILE = "log.jsonl"
+
+# Log timestamps are operator-local; the zone is resolved once at import
+LOG_TZ = ZoneInfo("America/Detroit")
+
+# Opened once on first use and reused for the rest of the run
+_log_file = None
+
+
+def _get_log_file():
+    """Return the shared append handle for the JSONL log"""
+    global _log_file
+    if _log_file is None:
+        # Block-buffered - per-field events stay in userspace until a
+        # terminal outcome in log_result flushes them (or the process exits)
+        _log_file = open(LOG_FILE, "a", buffering=1 << 16, encoding="utf-8")
+        atexit.register(_log_file.close)
+    return _log_file
+
+
+def timestamp():
+    """Current time as an ISO-8601 string in LOG_TZ"""
+    return datetime.now(LOG_TZ).isoformat()
+
+
+def log_event(entry):
+    """Append one event dict to the JSONL log via the shared handle"""
+    _get_log_file().write(dumps_line(entry))
+
 
 def log_result(job_url, status, reason="", steps_completed=0):
     """Log application result to JSONL file"""
     result = {
-        "timestamp": datetime.now(ZoneInfo("America/Detroit")).isoformat(),
+        "timestamp": timestamp(),
         "job_url": job_url,
         "status": status,
         "steps_completed": steps_completed,
@@ -16,8 +61,11 @@ def log_result(job_url, status, reason="", steps_completed=0):
     if reason:
         result["failure_reason"] = reason
 
-    with open("log.jsonl", "a") as f:
-        f.write(json.dumps(result) + "\n")
+    log_file = _get_log_file()
+    log_file.write(dumps_line(result))
+    # Every job ends in exactly one log_result - flush so the job's events
+    # are on disk before the next one starts
+    log_file.flush()
 
     print(f"[{status}] {job_url}")
     if reason: